@@ -0,0 +1,75 @@
+# Placing the repository root on sys.path so the tests can import the
+# financial_workbook_writing_application package.
+
+# Importing data management and testing packages:
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def build_raw_data(ticker, years=6, seed=0, split_date=None, split_ratio=2.0,
+ split_adjusted=True):
+    '''Builds a synthetic raw data dictionary in the format returned by
+    fetch_raw_data() for a quarterly dividend payer with an optional split.
+
+    Parameters
+    ----------
+    ticker : str
+        The title given to the raw data.
+
+    years : int
+        The number of years of business day prices, starting in 2012.
+
+    seed : int
+        The seed of the random walk of the Close price.
+
+    split_date : str, optional
+        The date of a split. The history has no splits if None.
+
+    split_ratio : float
+        The number of new shares per old share of the split.
+
+    split_adjusted : bool
+        If False the prices and dividends before the split are reported as
+        traded, otherwise on the split adjusted basis.
+
+    Returns
+    -------
+    raw_data : dict
+        {historical_prices, dividend_history, split_history, title, split_adjusted}
+    '''
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2012-01-01', '{}-12-31'.format(2011 + years))
+    close = pd.Series(50 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates)))), index=dates)
+
+    # Quarterly ex-dividend dates on the first business day from the 15th:
+    quarter_starts = pd.date_range(dates[0], dates[-1], freq='MS')
+    quarter_starts = quarter_starts[quarter_starts.month.isin([2, 5, 8, 11])]
+    div_dates = dates[np.searchsorted(dates, quarter_starts + pd.Timedelta(days=14))]
+    dividends = pd.Series(rng.uniform(0.4, 0.6, len(div_dates)), index=div_dates,
+     name='Dividends')
+
+    # Adj Close removes every later dividend from the split adjusted close:
+    dividend_factor = pd.Series(1.0, index=dates)
+    for date, amount in dividends.items():
+        dividend_factor[dates < date] *= 1 - amount / close[dates < date].iloc[-1]
+    adj_close = close * dividend_factor
+
+    splits = pd.Series(dtype=float, name='Stock Splits')
+    if split_date is not None:
+        split_date = dates[dates >= pd.Timestamp(split_date)][0]
+        splits = pd.Series([split_ratio], index=[split_date], name='Stock Splits')
+
+        if not split_adjusted:
+            close = close.where(dates >= split_date, close * split_ratio)
+            dividends = dividends.where(dividends.index >= split_date,
+             dividends * split_ratio)
+
+    return {'historical_prices': pd.DataFrame({'Close': close, 'Adj Close': adj_close}),
+     'dividend_history': dividends, 'split_history': splits, 'title': ticker,
+     'split_adjusted': split_adjusted}
+
+@pytest.fixture(scope='session')
+def raw_data_factory():
+    '''Returns build_raw_data() so tests can build raw data for many tickers.'''
+    return build_raw_data
@@ -0,0 +1,6 @@
+import sys
+
+from financial_workbook_writing_application.dividend_cli import main
+
+
+sys.exit(main())
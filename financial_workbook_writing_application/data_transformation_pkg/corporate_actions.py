@@ -0,0 +1,406 @@
+# Importing data management packages:
+import pandas as pd
+import numpy as np
+
+
+# The per share price columns that are divided by the split factors:
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+def _as_naive_dates(index):
+    '''Converts a datetime index to a numpy datetime64 array without timezone
+    information so price and dividend dates from different sources compare.'''
+    index = pd.DatetimeIndex(index)
+
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    return index.values
+
+def _cumulative_split_factors(dates, split_dates, split_ratios):
+    '''Returns an array containing, for every date, the product of the ratios
+    of all the splits that occur after that date. Dividing an as traded per
+    share value by its factor expresses it in terms of the current share count.
+
+    Both dates and split_dates must be sorted in ascending order.
+    '''
+
+    # The first row on or after each split; every row before it is adjusted:
+    positions = np.searchsorted(dates, split_dates, side='left')
+
+    increments = np.ones(len(dates) + 1)
+    np.multiply.at(increments, positions, split_ratios)
+
+    # Reverse cumulative product so each row picks up every later split:
+    return np.cumprod(increments[::-1])[::-1][1:]
+
+class corporate_action_adjustments(object):
+    """
+    The corporate_action_adjustments object holds the cumulative corporate
+    action factors of a single ticker as numpy arrays aligned with its
+    historical prices. The factors are computed once and are then applied
+    vectorially so that the dividend yields and the returns of the ticker are
+    calculated on one basis:
+
+    - Per share prices and dividends are split adjusted (current share count).
+    - Returns are the split adjusted Close multiplied by the dividend
+      reinvestment (adjustment) factor, ie: a total return price.
+
+    The split_adjusted indicator records the basis of the source data. Yahoo
+    finance (both the pandas_datareader prices and the yfinance dividends)
+    already reports split adjusted values, in which case the split factors
+    are not applied a second time. Sources that report as traded values set
+    split_adjusted to False and are divided by the split factors.
+
+    Attributes
+    ----------
+    dates : numpy array
+        The dates of the historical prices the factors are aligned with.
+
+    split_factors : numpy array
+        The cumulative product of the ratios of every split after each date.
+
+    adjustment_factors : numpy array
+        The source's Adj Close divided by the split adjusted Close on each
+        date. This is the dividend reinvestment part of the adjustment only.
+
+    split_adjusted : bool
+        True if the source prices and dividends are already split adjusted.
+
+    Methods
+    -------
+    adjust_prices(price_df)
+        Returns the price dataframe with per share prices split adjusted.
+
+    adjust_dividends(dividends)
+        Returns the dividend series split adjusted.
+
+    total_return_prices(price_df)
+        Returns the split and dividend adjusted Close that returns are
+        calculated from.
+
+    update(historical_prices, split_history)
+        Incrementally updates the factors with new prices and splits.
+
+    to_cache()
+        Returns the factors as a dictionary that can be cached.
+    """
+
+    def __init__(self, historical_prices, split_history, split_adjusted=True):
+        """
+        Parameters
+        ----------
+        historical_prices : pandas dataframe
+            The historical prices of the ticker containing the 'Close' and
+            'Adj Close' columns.
+
+        split_history : pandas Series
+            The split ratios of the ticker indexed by date (eg: 2.0 for a two
+            for one split).
+
+        split_adjusted : bool
+            True if the source prices and dividends are already split adjusted
+            (eg: yahoo finance), False if they are as traded.
+        """
+
+        self.split_adjusted = split_adjusted
+
+        # Storing the split history as sorted arrays:
+        self.split_dates, self.split_ratios = self._split_arrays(split_history)
+
+        # Computing the factors for every price date:
+        self.dates = _as_naive_dates(historical_prices.index)
+        self.split_factors = _cumulative_split_factors(self.dates,
+         self.split_dates, self.split_ratios)
+        self.adjustment_factors = self._adjustment_arrays(historical_prices,
+         self.split_factors)
+
+    def adjust_prices(self, price_df, columns=PRICE_COLUMNS):
+        '''Returns the per share price columns of price_df split adjusted. As
+        traded prices are divided by the split factors (and any 'Volume'
+        column multiplied by them), split adjusted prices are returned as is.
+
+        Parameters
+        ----------
+        price_df : pandas dataframe
+            The price dataframe, indexed by date in ascending order.
+
+        columns : tuple
+            The per share price columns to adjust. Missing columns are skipped.
+
+        Returns
+        -------
+        adjusted_df : pandas dataframe
+            A copy of price_df with the adjusted columns.
+        '''
+        adjusted_df = price_df.copy()
+
+        if self.split_adjusted:
+            return adjusted_df
+
+        factors = self.factors_for(price_df.index)
+
+        price_columns = [column for column in columns if column in adjusted_df.columns]
+        adjusted_df[price_columns] = adjusted_df[price_columns].values / factors[:, None]
+
+        if 'Volume' in adjusted_df.columns:
+            adjusted_df['Volume'] = adjusted_df['Volume'].values * factors
+
+        return adjusted_df
+
+    def adjust_dividends(self, dividends):
+        '''Returns the dividend payments split adjusted. As traded dividends
+        are divided by the split factor of their date, split adjusted
+        dividends are returned as is.
+
+        Parameters
+        ----------
+        dividends : pandas Series
+            The dividend payments indexed by date in ascending order.
+
+        Returns
+        -------
+        adjusted_dividends : pandas Series
+            The split adjusted dividend payments with the same index and name.
+        '''
+        if self.split_adjusted:
+            return dividends.copy()
+
+        return dividends / self.factors_for(dividends.index)
+
+    def total_return_prices(self, price_df):
+        '''Returns the split adjusted Close multiplied by the adjustment
+        factors, which is the total return price that returns are calculated
+        from. Dates that are not in the historical prices use the factor of
+        the closest earlier date.
+
+        Parameters
+        ----------
+        price_df : pandas dataframe
+            The price dataframe containing a 'Close' column, indexed by date in
+            ascending order.
+
+        Returns
+        -------
+        total_return_prices : pandas Series
+            The total return price of each date, named 'Close'.
+        '''
+        adjusted_close = self.adjust_prices(price_df, columns=('Close',))['Close']
+
+        dates = _as_naive_dates(price_df.index)
+        if len(dates) == len(self.dates) and np.array_equal(dates, self.dates):
+            adjustment_factors = self.adjustment_factors
+        else:
+            positions = np.searchsorted(self.dates, dates, side='right') - 1
+            adjustment_factors = self.adjustment_factors[np.clip(positions, 0, None)]
+
+        return adjusted_close * adjustment_factors
+
+    def factors_for(self, index):
+        '''Returns the split factors for an index of dates. The precomputed
+        array is returned when the index matches the historical prices,
+        otherwise the factors are looked up from the split arrays.
+
+        Parameters
+        ----------
+        index : pandas DatetimeIndex
+            The dates, in ascending order, to return the factors of.
+
+        Returns
+        -------
+        factors : numpy array
+            The split factor of each date.
+        '''
+        dates = _as_naive_dates(index)
+
+        if len(dates) == len(self.dates) and np.array_equal(dates, self.dates):
+            return self.split_factors
+
+        return _cumulative_split_factors(dates, self.split_dates, self.split_ratios)
+
+    def update(self, historical_prices, split_history):
+        '''Updates the factors with newer price data and splits without
+        recomputing the full history. Each new split multiplies only the rows
+        before it, and only the price rows after the last cached date are
+        appended.
+
+        Parameters
+        ----------
+        historical_prices : pandas dataframe
+            The historical prices of the ticker. Rows up to the last cached
+            date are only used to re-base the adjustment factors.
+
+        split_history : pandas Series
+            The full split history of the ticker.
+
+        Returns
+        -------
+        updated : bool
+            True if any factor changed.
+        '''
+
+        # Building from scratch if nothing was cached:
+        if len(self.dates) == 0:
+            self.__init__(historical_prices, split_history, self.split_adjusted)
+            return True
+
+        updated = False
+
+        # Applying any new split to the rows before it:
+        split_dates, split_ratios = self._split_arrays(split_history)
+        new_splits = ~np.isin(split_dates, self.split_dates)
+
+        for split_date, split_ratio in zip(split_dates[new_splits], split_ratios[new_splits]):
+            position = np.searchsorted(self.dates, split_date, side='left')
+            self.split_factors[:position] *= split_ratio
+            updated = True
+
+        if new_splits.any():
+            self.split_dates, self.split_ratios = split_dates, split_ratios
+
+        # Only the rows from the last cached date onwards are read:
+        last_date = self.dates[-1]
+        price_dates = _as_naive_dates(historical_prices.index)
+        anchor = np.searchsorted(price_dates, last_date, side='left')
+
+        recent_prices = historical_prices.iloc[anchor:]
+        recent_dates = price_dates[anchor:]
+        recent_split_factors = _cumulative_split_factors(recent_dates,
+         self.split_dates, self.split_ratios)
+        recent_adjustment_factors = self._adjustment_arrays(recent_prices,
+         recent_split_factors)
+
+        # Re-basing the cached adjustment factors if the source re-based them
+        # (eg: after a new dividend), using the last cached date as the anchor:
+        if len(recent_dates) and recent_dates[0] == last_date:
+            scale = recent_adjustment_factors[0] / self.adjustment_factors[-1]
+
+            if not np.isclose(scale, 1.0):
+                self.adjustment_factors *= scale
+                updated = True
+
+            recent_dates = recent_dates[1:]
+            recent_split_factors = recent_split_factors[1:]
+            recent_adjustment_factors = recent_adjustment_factors[1:]
+
+        # Appending the rows after the last cached date:
+        if len(recent_dates):
+            self.dates = np.concatenate([self.dates, recent_dates])
+            self.split_factors = np.concatenate([self.split_factors, recent_split_factors])
+            self.adjustment_factors = np.concatenate([self.adjustment_factors,
+             recent_adjustment_factors])
+            updated = True
+
+        return updated
+
+    def to_cache(self):
+        '''Returns the factors and split history as a dictionary of pandas
+        objects that can be stored by a security_data_cache.
+
+        Returns
+        -------
+        adjustment_data : dict
+            {factors: dataframe, splits: Series, split_adjusted: bool}
+        '''
+        factor_df = pd.DataFrame({'split_factor': self.split_factors,
+         'adjustment_factor': self.adjustment_factors}, index=self.dates)
+        split_series = pd.Series(self.split_ratios, index=self.split_dates,
+         name='Stock Splits')
+
+        return {'factors': factor_df, 'splits': split_series,
+         'split_adjusted': self.split_adjusted}
+
+    @classmethod
+    def from_cache(cls, adjustment_data):
+        '''Rebuilds a corporate_action_adjustments object from the dictionary
+        produced by to_cache() without recomputing any factor.
+
+        Parameters
+        ----------
+        adjustment_data : dict
+            {factors: dataframe, splits: Series, split_adjusted: bool}
+
+        Returns
+        -------
+        adjustments : corporate_action_adjustments
+        '''
+        adjustments = cls.__new__(cls)
+
+        factor_df = adjustment_data['factors']
+        adjustments.split_adjusted = adjustment_data.get('split_adjusted', True)
+        adjustments.dates = _as_naive_dates(factor_df.index)
+        adjustments.split_factors = np.array(factor_df['split_factor'], dtype=float)
+        adjustments.adjustment_factors = np.array(factor_df['adjustment_factor'], dtype=float)
+        adjustments.split_dates, adjustments.split_ratios = cls._split_arrays(
+         adjustment_data['splits'])
+
+        return adjustments
+
+    @staticmethod
+    def _split_arrays(split_history):
+        '''Returns the split dates and ratios as sorted numpy arrays, ignoring
+        any zero (no split) entries.'''
+        split_history = split_history[split_history > 0].sort_index()
+
+        return (_as_naive_dates(split_history.index),
+         np.array(split_history.values, dtype=float))
+
+    def _adjustment_arrays(self, historical_prices, split_factors):
+        '''Returns the source's Adj Close divided by the split adjusted Close
+        for every price date, leaving only the dividend adjustment.'''
+        adjustment_factors = np.array(historical_prices['Adj Close'] /
+         historical_prices['Close'], dtype=float)
+
+        # As traded closes include the splits that Adj Close has removed:
+        if not self.split_adjusted:
+            adjustment_factors = adjustment_factors * split_factors
+
+        return adjustment_factors
+
+def load_corporate_actions(ticker, historical_prices, split_history, cache=None,
+ split_adjusted=True):
+    '''Returns the corporate_action_adjustments of a ticker. If a
+    security_data_cache is given the cached factors are updated incrementally
+    and written back only when they change.
+
+    Parameters
+    ----------
+    ticker : str
+        The ticker symbol the factors belong to.
+
+    historical_prices : pandas dataframe
+        The historical prices of the ticker.
+
+    split_history : pandas Series
+        The split history of the ticker.
+
+    cache : security_data_cache, optional
+        The cache the factors are stored in alongside the raw data.
+
+    split_adjusted : bool
+        True if the source prices and dividends are already split adjusted.
+        Cached factors built for the other basis are rebuilt.
+
+    Returns
+    -------
+    adjustments : corporate_action_adjustments
+    '''
+
+    if cache is None:
+        return corporate_action_adjustments(historical_prices, split_history,
+         split_adjusted)
+
+    adjustment_data = cache.load_adjustments(ticker)
+
+    if adjustment_data is None or adjustment_data.get('split_adjusted', True) != split_adjusted:
+        adjustments = corporate_action_adjustments(historical_prices, split_history,
+         split_adjusted)
+        updated = True
+
+    else:
+        adjustments = corporate_action_adjustments.from_cache(adjustment_data)
+        updated = adjustments.update(historical_prices, split_history)
+
+    if updated:
+        cache.store_adjustments(ticker, adjustments.to_cache())
+
+    return adjustments
@@ -10,9 +10,16 @@ from financial_workbook_writing_application.raw_data_extraction_pkg\
 from financial_workbook_writing_application.statistical_data_validation_pkg\
 .normality_testing import normality_validation as normality
 
+# Importing the corporate action adjustment stage:
+from financial_workbook_writing_application.data_transformation_pkg\
+.corporate_actions import load_corporate_actions
+
+# Importing the dividend payment schedule index:
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_schedule import payment_schedule_index
+
 # Importing data management packages:
 import pandas as pd
-from collections import Counter
 import numpy as np
 
 # Importing data vizualization packages:
@@ -31,6 +38,15 @@ class dividend_asset(Security):
 
     Methods
     ---------
+    build_corporate_actions()
+        Returns the corporate action adjustment factors of the asset.
+
+    return_prices()
+        Returns the total return price the parent's returns are calculated from.
+
+    build_payment_schedule()
+        Returns the index of the asset's dividend payment schedule.
+
     build_hist_div_yields()
         Returns a dataframe containing the historical quarterly dividend yield.
 
@@ -45,7 +61,7 @@ class dividend_asset(Security):
          metrics.
     """
 
-    def __init__(self, ticker, plot):
+    def __init__(self, ticker, plot, raw_data=None, cache=None):
         """
         Parameters
         ----------
@@ -60,14 +76,31 @@ class dividend_asset(Security):
         plot : bool
             This boolean indicator is used to dictate if any of the validation
             tests plot their outputs or not.
+
+        raw_data : dict, optional
+            A dictionary of pre-fetched raw data that is passed to the parent
+            Security() object so that no web requests are made on construction.
+
+        cache : security_data_cache, optional
+            The cache that the corporate action adjustment factors are stored
+            in and incrementally updated from.
         """
 
-        # Inherent parnet __init__ for web_based_financial_models asset():
-        super().__init__(ticker)
         self.plot = plot
+        self.cache = cache
+
+        # Inherent parnet __init__ for web_based_financial_models asset(). The
+        # parent calculates its returns through return_prices(), which also
+        # builds the split adjustment factors in self.corporate_actions:
+        super().__init__(ticker, raw_data)
 
-        # Quarterly and annual dividend yield:
+        # Historical dividend yields:
         self.hist_div_yields = self.build_hist_div_yields()
+
+        # Payment frequency, typical ex-dates and per year payment counts:
+        self.payment_schedule = self.build_payment_schedule()
+
+        # Annual dividend yield:
         self.annual_div_yields = self.build_annual_div_yields()
 
         # Dividend Data Analysis:
@@ -75,6 +108,49 @@ class dividend_asset(Security):
         self.dividend_volatility = self.build_dividend_volatility()
 
 
+    def build_corporate_actions(self):
+        '''Returns the corporate action adjustment factors of the asset, loading
+        and incrementally updating them from self.cache if one was provided.
+
+        Returns
+        -------
+        corporate_actions : corporate_action_adjustments
+            The object containing the cumulative split and adjustment factor
+            arrays aligned with self.historical_prices.
+        '''
+        return load_corporate_actions(self.ticker, self.historical_prices,
+         self.split_history, self.cache, self.split_adjusted)
+
+    def return_prices(self):
+        '''Returns the total return price (split adjusted Close multiplied by
+        the dividend adjustment factors) of the asset. It overrides the
+        Security() method so that the parent's returns share one split basis
+        with the dividend yields. The parent calls it before the split history
+        is used anywhere else, so self.corporate_actions is built here.
+
+        Returns
+        -------
+        total_return_prices : pandas series
+            The total return price indexed by date.
+        '''
+        self.corporate_actions = self.build_corporate_actions()
+
+        return self.corporate_actions.total_return_prices(self.historical_prices)
+
+    def build_payment_schedule(self):
+        '''Returns the payment schedule index of the asset built from the split
+        adjusted dividends in self.hist_div_yields, so that only the payments
+        the yields are calculated from are counted.
+
+        Returns
+        -------
+        payment_schedule : payment_schedule_index
+            The object containing the detected payment frequency, typical
+            ex-dividend date offsets, last paid period and per year payment
+            counts of the asset.
+        '''
+        return payment_schedule_index(self.ticker, self.hist_div_yields['Dividends'])
+
     def build_hist_div_yields(self):
         '''Returns a dataframe containing the historical dividend yields of the asset
         based on the historical_prices dataframe inhereted by the parent asset
@@ -86,9 +162,13 @@ class dividend_asset(Security):
             The dataframe containing all the dividend yields against historical
             timeseries.
         '''
+        # Putting the prices and dividend payments on the same split adjusted basis:
+        adjusted_prices = self.corporate_actions.adjust_prices(self.historical_prices)
+        adjusted_dividends = self.corporate_actions.adjust_dividends(self.dividend_history)
+
         # Merging historical pricing data with absoloute dividend payments:
-        Adj_close = pd.DataFrame(self.historical_prices['Close'])
-        div_payments = Adj_close.merge(self.dividend_history, left_index=True,
+        Adj_close = pd.DataFrame(adjusted_prices['Close'])
+        div_payments = Adj_close.merge(adjusted_dividends, left_index=True,
         right_index=True)
 
         # Creating new div_payments column to show % Yield:
@@ -121,20 +201,14 @@ class dividend_asset(Security):
 
         # Creating a list of all the years in which dividends were paid:
         year_list = grouped_yield_df.index
-        ungrouped_year_list = percent_yield.index.year
-
-        # Parsing grouped_yield_df to remove any years that do not have 4 quarters
-        # do to them potentally skewing the data in future calculations:
-        counted_years_list = Counter(ungrouped_year_list)
 
-        # For loop that tests each year for 4 quarters and removes the rest:
-        for x in year_list:
+        # Parsing grouped_yield_df to remove any years that do not contain every
+        # payment of the asset's schedule (eg: 4 for a quarterly payer) do to them
+        # potentally skewing the data in future calculations:
+        complete_years = [x for x in year_list
+         if self.payment_schedule.is_complete_year(x)]
 
-            if counted_years_list[x] != 4:
-                grouped_yield_df.drop(x, inplace=True)
-
-            else:
-                pass
+        grouped_yield_df = grouped_yield_df.loc[complete_years]
 
         # Removing all unnecessary columns for final df return:
         annual_div_df = grouped_yield_df['% Yield']
@@ -199,14 +273,16 @@ class dividend_asset(Security):
         Returns
         -------
         volatility_dict : A dictionary containing all the dividend volatility
-        metrics:
-        {pct_yield: pct_yield, divided_std: divided_std, div_pct_change: div_pct_change}
+        metrics and whether the yields passed every normality test:
+        {pct_yield: pct_yield, divided_std: divided_std, div_pct_change: div_pct_change,
+        gaussian: gaussian}
         '''
 
         # Performing data validation before transformation:
         pct_yield = self.annual_div_yields # Extracting series from df.
         alpha = 0.05
-        normality(self.annual_div_yields, alpha, self.plot)
+        normality_test = normality(self.annual_div_yields, alpha, self.plot)
+        gaussian = bool(normality_test.summary_df['Gaussian indicator'].all())
 
         # Generating standard deviation:
         divided_std = pct_yield.std()
@@ -217,7 +293,7 @@ class dividend_asset(Security):
 
         # Creating and returning the dictionary that the method returns:
         volatility_dict = {'pct_yield': pct_yield, 'divided_std': divided_std,
-        'div_pct_change': div_pct_change}
+        'div_pct_change': div_pct_change, 'gaussian': gaussian}
 
         return volatility_dict
 
@@ -248,7 +324,7 @@ class div_asset_comparison(object):
 
     """
 
-    def __init__(self, *tickers):
+    def __init__(self, *tickers, dividend_assets=None):
         """
         Parameters
         ----------
@@ -257,11 +333,20 @@ class div_asset_comparison(object):
             will be initalized by the dividend_asset() object. Each dataframe
             generated by this object will be a comparitive dataframe that
             compares each tiker input in the *ticker argument.
+
+        dividend_assets : iterable, optional
+            Already initalized dividend_asset() objects (eg: the output of the
+            dividend_pipeline) that are compared alongside the *tickers.
         """
 
         # Initalizing a dictionary that contains all the ticker objects:
         self.ticker_dict = {}
 
+        # Storing any pre-built dividend_asset() objects:
+        if dividend_assets is not None:
+            for div_obj in dividend_assets:
+                self.ticker_dict.update({div_obj.ticker: div_obj})
+
         # Initalizing every ticker input as a dividend_asset() object and storing
         # them in an instance dictionary:
         for ticker in tickers:
@@ -321,6 +406,8 @@ class div_asset_comparison(object):
         for ticker in self.ticker_dict:
             aggregate_std_dict.update({ticker : self.ticker_dict[ticker].dividend_volatility['divided_std']})
 
+        return aggregate_std_dict
+
     def pct_change_aggregator(self):
         '''The method aggregates the percent change of the % Dividend Yield for
         each ticker symbol and returns it as a dataframe.
@@ -369,4 +456,5 @@ class div_asset_comparison(object):
         return agg_div_drawdown_dict
 
 
-div_asset_comparison('WM', 'SPY', 'XOM')
+if __name__ == '__main__':
+    div_asset_comparison('WM', 'SPY', 'XOM')
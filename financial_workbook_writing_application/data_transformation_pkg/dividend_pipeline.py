@@ -0,0 +1,293 @@
+# Path hack:
+import sys
+sys.path.append('..')
+
+# Importing the dividend transformation objects:
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_data_transformation import dividend_asset, div_asset_comparison
+
+# Importing the default raw data provider:
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.data_providers import yahoo_data_provider
+
+# Importing concurrency packages:
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+# Misc packages imports:
+import time
+
+
+# Sentinel placed on a queue to tell a worker that its input is exhausted:
+_STOP = object()
+
+class dividend_pipeline(object):
+    """
+    The dividend_pipeline object runs the fetch, transform and load steps of
+    the dividend workbook as seperate asyncio stages connected by bounded
+    queues. Raw data for ticker N+1 is fetched while ticker N is being
+    transformed, and a slow loader fills the queues which in turn pauses the
+    upstream stages (backpressure).
+
+    fetch -> [raw queue] -> transform -> [asset queue] -> load
+
+    Methods
+    -------
+    run(tickers)
+        Coroutine that pushes every ticker through the pipeline and returns a
+        dictionary of dividend_asset() objects.
+
+    process(tickers)
+        Synchronous wrapper around run() for non-async callers.
+
+    build_comparison(tickers)
+        Runs the pipeline and returns a div_asset_comparison() object built
+        from its output.
+    """
+
+    def __init__(self, provider=None, loader=None, fetch_workers=4,
+     transform_workers=2, load_workers=1, queue_size=8, executor=None,
+     cache=None):
+        """
+        Parameters
+        ----------
+        provider : object, optional
+            Any object with a fetch(ticker) method that returns the raw data
+            dictionary for a ticker. fetch() may be a regular function, which
+            is run in a worker thread, or a coroutine function. Defaults to
+            yahoo_data_provider().
+
+        loader : callable, optional
+            A function or coroutine function called as loader(ticker, div_obj)
+            for every successfully transformed ticker. A regular function is
+            run in a worker thread. The pipeline output is returned regardless
+            of the loader.
+
+        fetch_workers : int
+            The number of concurrent fetch tasks. Every worker count and the
+            queue size must be at least 1.
+
+        transform_workers : int
+            The number of concurrent transformation tasks.
+
+        load_workers : int
+            The number of concurrent load tasks.
+
+        queue_size : int
+            The maximum number of items held in each of the inter-stage queues.
+            This bounds the memory used by in-flight tickers.
+
+        executor : concurrent.futures.Executor, optional
+            The executor that blocking fetch, transformation and load calls are
+            run in. A thread pool sized to the worker counts is created for
+            each run if not provided.
+
+        cache : security_data_cache, optional
+            The cache passed to every dividend_asset() so that corporate action
+            adjustment factors are reused between runs.
+        """
+
+        for name, value in (('fetch_workers', fetch_workers), ('transform_workers',
+         transform_workers), ('load_workers', load_workers), ('queue_size', queue_size)):
+            if value < 1:
+                raise ValueError('{} must be at least 1, got {}'.format(name, value))
+
+        # Declaring instance variables:
+        self.provider = provider if provider is not None else yahoo_data_provider()
+        self.loader = loader
+        self.fetch_workers = fetch_workers
+        self.transform_workers = transform_workers
+        self.load_workers = load_workers
+        self.queue_size = queue_size
+        self.executor = executor
+        self.cache = cache
+
+        # Instance variables that are populated by each run:
+        self.errors = {}
+        self.stage_timings = {}
+
+    async def run(self, tickers):
+        '''Pushes every ticker through the fetch, transform and load stages.
+        Tickers that fail in any stage are recorded in self.errors and do not
+        stop the rest of the pipeline.
+
+        Parameters
+        ----------
+        tickers : iterable
+            The ticker symbols to process.
+
+        Returns
+        -------
+        asset_dict : dict
+            A dictionary of dividend_asset() objects indexed by ticker, in the
+            order the tickers were input.
+        '''
+
+        tickers = list(tickers)
+
+        # Resetting the per-run instance variables:
+        self.errors = {}
+        self.stage_timings = {'fetch': 0.0, 'transform': 0.0, 'load': 0.0}
+        results = {}
+
+        # Creating a thread pool if an executor was not provided:
+        executor = self.executor
+        if executor is None:
+            executor = ThreadPoolExecutor(self.fetch_workers + self.transform_workers
+             + self.load_workers)
+
+        # Building the queues that connect each stage:
+        ticker_queue = asyncio.Queue()
+        raw_queue = asyncio.Queue(maxsize=self.queue_size)
+        asset_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        for ticker in tickers:
+            ticker_queue.put_nowait(ticker)
+
+        fetchers = [asyncio.create_task(self._fetch_worker(ticker_queue,
+         raw_queue, executor)) for _ in range(self.fetch_workers)]
+        transformers = [asyncio.create_task(self._transform_worker(raw_queue,
+         asset_queue, executor)) for _ in range(self.transform_workers)]
+        loaders = [asyncio.create_task(self._load_worker(asset_queue, results,
+         executor)) for _ in range(self.load_workers)]
+
+        try:
+            # Shutting each stage down once the stage before it is finished:
+            await asyncio.gather(*fetchers)
+            for _ in transformers:
+                await raw_queue.put(_STOP)
+
+            await asyncio.gather(*transformers)
+            for _ in loaders:
+                await asset_queue.put(_STOP)
+
+            await asyncio.gather(*loaders)
+
+        finally:
+            for task in fetchers + transformers + loaders:
+                task.cancel()
+
+            if self.executor is None:
+                executor.shutdown(wait=False)
+
+        # Restoring input order:
+        asset_dict = {ticker: results[ticker] for ticker in tickers
+         if ticker in results}
+
+        return asset_dict
+
+    def process(self, tickers):
+        '''Synchronous wrapper around run().
+
+        Parameters
+        ----------
+        tickers : iterable
+            The ticker symbols to process.
+
+        Returns
+        -------
+        asset_dict : dict
+            A dictionary of dividend_asset() objects indexed by ticker.
+        '''
+        return asyncio.run(self.run(tickers))
+
+    def build_comparison(self, tickers):
+        '''Runs the pipeline and initalizes a div_asset_comparison() object from
+        the dividend_asset() objects it produces.
+
+        Parameters
+        ----------
+        tickers : iterable
+            The ticker symbols to compare.
+
+        Returns
+        -------
+        comparison : div_asset_comparison
+            The comparison object containing every ticker that completed the
+            pipeline.
+        '''
+        asset_dict = self.process(tickers)
+
+        return div_asset_comparison(dividend_assets=asset_dict.values())
+
+    async def _fetch_worker(self, ticker_queue, raw_queue, executor):
+        '''Fetches raw data for tickers until ticker_queue is empty.'''
+
+        loop = asyncio.get_running_loop()
+
+        while not ticker_queue.empty():
+            ticker = ticker_queue.get_nowait()
+            start = time.perf_counter()
+
+            try:
+                if inspect.iscoroutinefunction(self.provider.fetch):
+                    raw_data = await self.provider.fetch(ticker)
+                else:
+                    raw_data = await loop.run_in_executor(executor,
+                     self.provider.fetch, ticker)
+
+            except Exception as error:
+                self.errors[ticker] = error
+                continue
+
+            finally:
+                self.stage_timings['fetch'] += time.perf_counter() - start
+
+            # Blocks while the transformation stage is behind:
+            await raw_queue.put((ticker, raw_data))
+
+    async def _transform_worker(self, raw_queue, asset_queue, executor):
+        '''Builds dividend_asset() objects from raw data until stopped.'''
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await raw_queue.get()
+            if item is _STOP:
+                break
+
+            ticker, raw_data = item
+            start = time.perf_counter()
+
+            try:
+                div_obj = await loop.run_in_executor(executor, dividend_asset,
+                 ticker, False, raw_data, self.cache)
+
+            except Exception as error:
+                self.errors[ticker] = error
+                continue
+
+            finally:
+                self.stage_timings['transform'] += time.perf_counter() - start
+
+            # Blocks while the load stage is behind:
+            await asset_queue.put((ticker, div_obj))
+
+    async def _load_worker(self, asset_queue, results, executor):
+        '''Passes dividend_asset() objects to the loader until stopped.'''
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await asset_queue.get()
+            if item is _STOP:
+                break
+
+            ticker, div_obj = item
+            start = time.perf_counter()
+
+            try:
+                if self.loader is not None:
+                    if inspect.iscoroutinefunction(self.loader):
+                        await self.loader(ticker, div_obj)
+                    else:
+                        await loop.run_in_executor(executor, self.loader,
+                         ticker, div_obj)
+
+                results[ticker] = div_obj
+
+            except Exception as error:
+                self.errors[ticker] = error
+
+            finally:
+                self.stage_timings['load'] += time.perf_counter() - start
@@ -0,0 +1,294 @@
+# Importing data management packages:
+import pandas as pd
+import numpy as np
+
+
+# The payment frequencies (payments per year) a schedule can be snapped to:
+FREQUENCIES = (1, 2, 4, 12)
+
+class payment_schedule_index(object):
+    """
+    The payment_schedule_index object summarizes the dividend payment schedule
+    of a single ticker. It is built once from the dividend history so that
+    completeness checks and forward projections are dictionary lookups rather
+    than scans of the history.
+
+    Attributes
+    ----------
+    frequency : int
+        The number of payments per year (1, 2, 4 or 12) of the most recent
+        payments, used to forecast payments. 0 if the ticker has never paid a
+        dividend.
+
+    year_frequencies : dict
+        The expected number of payments in each year. A change of schedule (eg:
+        quarterly to monthly) is only accepted when it persists into a
+        neighbouring year, so that it does not mark the years before it
+        incomplete while a year with missing payments is still incomplete.
+
+    payment_counts : dict
+        The number of payments made in each year.
+
+    year_totals : dict
+        The sum of the payments made in each year.
+
+    typical_offsets : dict
+        The median number of days between the start of each payment period
+        (eg: each quarter) and its ex-dividend date, indexed by period number.
+
+    last_paid : pandas Timestamp
+        The date of the most recent payment.
+
+    last_paid_period : tuple
+        The (year, period number) of the most recent payment.
+
+    last_amount : float
+        The amount of the most recent payment.
+
+    Methods
+    -------
+    is_complete_year(year)
+        Returns True if the year contains every expected payment.
+
+    projected_forward_yield(price, year)
+        Returns the % yield of a year with its missing payments projected.
+
+    forecast_calendar(start, end)
+        Returns a dataframe of the expected payments between two dates.
+    """
+
+    def __init__(self, ticker, dividend_history, lookback_years=3):
+        """
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol the dividend history belongs to.
+
+        dividend_history : pandas Series
+            The dividend payments indexed by ex-dividend date.
+
+        lookback_years : int
+            The number of most recent years of payments used to detect the
+            payment frequency and the typical ex-dividend date offsets.
+        """
+
+        self.ticker = ticker
+
+        dividend_history = dividend_history.sort_index()
+        dates = pd.DatetimeIndex(dividend_history.index)
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+
+        # Per year payment counts and totals:
+        years = dates.year.values
+        amounts = np.array(dividend_history.values, dtype=float)
+        unique_years, year_index, counts = np.unique(years, return_inverse=True,
+         return_counts=True)
+
+        self.payment_counts = dict(zip(unique_years.tolist(), counts.tolist()))
+        self.year_totals = dict(zip(unique_years.tolist(),
+         np.bincount(year_index, weights=amounts).tolist()))
+
+        if len(dates) == 0:
+            self.frequency = 0
+            self.year_frequencies = {}
+            self.typical_offsets = {}
+            self.last_paid = None
+            self.last_paid_period = None
+            self.last_amount = 0.0
+            return
+
+        # Restricting the schedule detection to the most recent payments:
+        recent = dates >= dates[-1] - pd.DateOffset(years=lookback_years)
+        self.frequency = self._detect_frequency(dates[recent])
+        self.year_frequencies = self._detect_year_frequencies(dates, unique_years,
+         self.frequency)
+
+        # Median offset of the ex-dividend date into each payment period:
+        periods, period_starts = self._periods(dates[recent])
+        offsets = pd.Series((dates[recent] - period_starts).days, index=periods)
+        self.typical_offsets = offsets.groupby(level=0).median().round().astype(int).to_dict()
+
+        self.last_paid = dates[-1]
+        self.last_paid_period = (dates[-1].year, int(self._periods(dates[-1:])[0][0]))
+        self.last_amount = float(amounts[-1])
+
+    def is_complete_year(self, year):
+        '''Returns True if every payment expected in the year was made.
+
+        Parameters
+        ----------
+        year : int
+            The calendar year to check.
+
+        Returns
+        -------
+        complete : bool
+        '''
+        expected = self.year_frequencies.get(year, self.frequency)
+
+        return expected > 0 and self.payment_counts.get(year, 0) == expected
+
+    def payments_in_year(self, year):
+        '''Returns the number of payments made in the year.'''
+        return self.payment_counts.get(year, 0)
+
+    def projected_forward_yield(self, price, year=None):
+        '''Returns the % dividend yield of a year in which the payments not yet
+        made are assumed to equal the most recent payment.
+
+        Parameters
+        ----------
+        price : float
+            The price the yield is calculated against.
+
+        year : int, optional
+            The year to project. Defaults to the year of the last payment.
+
+        Returns
+        -------
+        forward_yield : float
+            The projected annual dividend yield as a percentage.
+        '''
+        if year is None:
+            year = self.last_paid.year if self.last_paid is not None else 0
+
+        missing_payments = max(self.frequency - self.payments_in_year(year), 0)
+        projected_total = self.year_totals.get(year, 0.0) + missing_payments * self.last_amount
+
+        return (projected_total / price) * 100
+
+    def forecast_calendar(self, start=None, end=None):
+        '''Returns the payments expected between start and end, continuing the
+        schedule from the last paid period with the typical ex-dividend date
+        offsets and the most recent payment amount.
+
+        Parameters
+        ----------
+        start : datetime-like, optional
+            The first date of the calendar. Defaults to today.
+
+        end : datetime-like, optional
+            The last date of the calendar. Defaults to one year after start.
+
+        Returns
+        -------
+        calendar_df : pandas dataframe
+            The dataframe of expected payments with the columns:
+
+            [ticker, ex_date, amount]
+        '''
+        start = pd.Timestamp.today().normalize() if start is None else pd.Timestamp(start)
+        end = start + pd.DateOffset(years=1) if end is None else pd.Timestamp(end)
+
+        ex_dates = []
+
+        if self.frequency > 0:
+            period_months = 12 // self.frequency
+            default_offset = int(np.median(list(self.typical_offsets.values())))
+
+            # Stepping through the periods after the last one that was paid:
+            year, period = self.last_paid_period
+            while True:
+                period += 1
+                if period == self.frequency:
+                    year, period = year + 1, 0
+
+                period_start = pd.Timestamp(year, period * period_months + 1, 1)
+                if period_start > end:
+                    break
+
+                ex_date = period_start + pd.Timedelta(days=self.typical_offsets.get(period,
+                 default_offset))
+
+                if start <= ex_date <= end:
+                    ex_dates.append(ex_date)
+
+        calendar_df = pd.DataFrame({'ticker': self.ticker, 'ex_date': pd.DatetimeIndex(ex_dates),
+         'amount': self.last_amount})
+
+        return calendar_df
+
+    def _periods(self, dates):
+        '''Returns the period number of each date and the start of its period
+        given self.frequency.'''
+        period_months = 12 // self.frequency
+        periods = (dates.month.values - 1) // period_months
+
+        period_starts = pd.to_datetime({'year': dates.year.values,
+         'month': periods * period_months + 1, 'day': 1})
+
+        return periods, pd.DatetimeIndex(period_starts)
+
+    @staticmethod
+    def _detect_frequency(dates):
+        '''Snaps the median number of days between payments to the nearest
+        standard payment frequency.'''
+        if len(dates) < 2:
+            return 1
+
+        median_gap = np.median(np.diff(dates.values).astype('timedelta64[D]').astype(float))
+
+        return payment_schedule_index._snap_frequency(median_gap)
+
+    @staticmethod
+    def _detect_year_frequencies(dates, years, default_frequency):
+        '''Snaps the median number of days between the payments made in each
+        year (including the gap from the payment before it) to the nearest
+        standard payment frequency. A year's own frequency is only used if the
+        year before or after it has the same frequency, otherwise missing
+        payments would lower the number of payments the year is expected to
+        contain. Other years take the frequency of the years before them, or
+        after them if there are none.'''
+        if len(dates) < 2:
+            return {year: default_frequency for year in years.tolist()}
+
+        gaps = pd.Series(np.diff(dates.values).astype('timedelta64[D]').astype(float),
+         index=dates.year.values[1:])
+        median_gaps = gaps.groupby(level=0).median().reindex(years)
+        frequencies = median_gaps.map(payment_schedule_index._snap_frequency,
+         na_action='ignore')
+
+        # Keeping only the frequencies shared with a neighbouring year:
+        persistent = (frequencies == frequencies.shift(1)) | (frequencies == frequencies.shift(-1))
+        frequencies = frequencies.where(persistent).ffill().bfill().fillna(default_frequency)
+
+        return {year: int(frequency) for year, frequency in frequencies.items()}
+
+    @staticmethod
+    def _snap_frequency(median_gap):
+        '''Returns the standard payment frequency nearest to a median number of
+        days between payments.'''
+        payments_per_year = 365.25 / max(median_gap, 1.0)
+
+        return min(FREQUENCIES, key=lambda frequency: abs(frequency - payments_per_year))
+
+def build_dividend_calendar(schedules, start=None, end=None):
+    '''Combines the forecast calendars of many tickers into a single calendar
+    of expected dividend payments for cash flow planning.
+
+    Parameters
+    ----------
+    schedules : iterable
+        The payment_schedule_index() objects of each ticker.
+
+    start : datetime-like, optional
+        The first date of the calendar. Defaults to today.
+
+    end : datetime-like, optional
+        The last date of the calendar. Defaults to one year after start.
+
+    Returns
+    -------
+    calendar_df : pandas dataframe
+        The expected payments of every ticker sorted by ex-dividend date with
+        the columns: [ticker, ex_date, amount]
+    '''
+    calendars = [schedule.forecast_calendar(start, end) for schedule in schedules]
+
+    if not calendars:
+        return pd.DataFrame(columns=['ticker', 'ex_date', 'amount'])
+
+    calendar_df = pd.concat(calendars, ignore_index=True)
+
+    return calendar_df.sort_values(['ex_date', 'ticker'], ignore_index=True)
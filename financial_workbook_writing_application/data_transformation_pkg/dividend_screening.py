@@ -0,0 +1,264 @@
+# Importing data management packages:
+import pandas as pd
+import numpy as np
+# Misc packages imports:
+import re
+
+
+# Short names that may be used in screening expressions for metric columns.
+# 'yield' is a python keyword so it can not be evaluated as a column name:
+METRIC_ALIASES = {'yield': 'div_yield', 'drawdown': 'max_drawdown'}
+
+# A comparison of a single metric against a number, eg: 'div_yield > 3':
+_SIMPLE_CLAUSE = re.compile(r'^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*$')
+
+def build_screening_metrics(dividend_assets):
+    '''Builds a dataframe of the single value dividend metrics of each
+    dividend_asset() object that the screener filters and ranks on.
+
+    Parameters
+    ----------
+    dividend_assets : iterable
+        The dividend_asset() objects to compute the metrics of.
+
+    Returns
+    -------
+    metrics_df : pandas dataframe
+        The dataframe indexed by ticker with the columns:
+
+        div_yield : The most recent complete annual % dividend yield.
+        forward_yield : The projected % dividend yield of the last paid year.
+        std : The standard deviation of the annual % dividend yields.
+        max_drawdown : The maximum annual drawdown of the % dividend yield.
+        growth : The average annual % change of the % dividend yield.
+        gaussian : 1.0 if the annual yields passed every normality test.
+    '''
+    dividend_assets = list(dividend_assets)
+
+    metrics_df = pd.DataFrame({
+        'div_yield': [asset.annual_div_yields.iloc[-1]
+         if len(asset.annual_div_yields) else np.nan for asset in dividend_assets],
+        'forward_yield': [asset.payment_schedule.projected_forward_yield(
+         asset.historical_prices['Close'].iloc[-1]) for asset in dividend_assets],
+        'std': [asset.dividend_volatility['divided_std'] for asset in dividend_assets],
+        'max_drawdown': [asset.max_drawdown['max_annual_drawdown'] for asset in dividend_assets],
+        'growth': [asset.dividend_volatility['div_pct_change'].mean() * 100
+         for asset in dividend_assets],
+        'gaussian': [float(asset.dividend_volatility['gaussian']) for asset in dividend_assets]},
+        index=pd.Index([asset.ticker for asset in dividend_assets], name='ticker'))
+
+    return metrics_df
+
+class dividend_screener(object):
+    """
+    The dividend_screener object filters and ranks a universe of tickers on
+    their precomputed dividend metrics. Simple comparisons against a number
+    are answered from a sorted index of the metric column, other expressions
+    are evaluated vectorially over the columns, and the top ranked tickers are
+    selected with a partial sort.
+
+    Expressions refer to the metric columns by name (or by the aliases in
+    METRIC_ALIASES) and percentages are written in the same units as the
+    % yields, eg:
+
+    screener.screen('yield > 3% and drawdown < 1', rank_by='yield / std', top=10)
+
+    Methods
+    -------
+    filter(where)
+        Returns a boolean array of the tickers that satisfy the expression.
+
+    score(expression)
+        Returns the value of an expression for every ticker.
+
+    screen(where, rank_by, top, ascending)
+        Returns the metrics of the tickers that satisfy where, ranked by
+        rank_by.
+    """
+
+    def __init__(self, metrics_df):
+        """
+        Parameters
+        ----------
+        metrics_df : pandas dataframe
+            The numeric metrics of each ticker indexed by ticker, eg: the output
+            of build_screening_metrics().
+        """
+        self.metrics = metrics_df
+        self.columns = {column: np.asarray(metrics_df[column], dtype=float)
+         for column in metrics_df.columns}
+
+        # Sorted indexes of the metric columns, built the first time a column
+        # is filtered on:
+        self._sorted_indexes = {}
+
+    @classmethod
+    def from_comparison(cls, comparison):
+        '''Builds a screener over every ticker in a div_asset_comparison() object.
+
+        Parameters
+        ----------
+        comparison : div_asset_comparison
+            The comparison object whose dividend_asset() objects are screened.
+
+        Returns
+        -------
+        screener : dividend_screener
+        '''
+        return cls(build_screening_metrics(comparison.ticker_dict.values()))
+
+    def filter(self, where):
+        '''Evaluates a filter expression. Expressions made of simple comparisons
+        joined by 'and' are answered clause by clause, using the sorted index
+        of the column for every comparison against a number.
+
+        Parameters
+        ----------
+        where : str
+            The filter expression, eg: 'yield > 3% and drawdown < 1'.
+
+        Returns
+        -------
+        mask : numpy array
+            A boolean array that is True for every ticker that satisfies where.
+        '''
+        where = self._normalize(where)
+
+        # Expressions that can not be split into independent clauses:
+        if re.search(r'\bor\b|\bnot\b|[()|~]', where):
+            return np.asarray(self._evaluate(where), dtype=bool)
+
+        mask = np.ones(len(self.metrics), dtype=bool)
+
+        for clause in re.split(r'\band\b|&', where):
+            match = _SIMPLE_CLAUSE.match(clause)
+
+            if match is not None and match.group(1) in self.columns:
+                mask &= self._index_lookup(match.group(1), match.group(2),
+                 float(match.group(3)))
+            else:
+                mask &= np.asarray(self._evaluate(clause), dtype=bool)
+
+        return mask
+
+    def score(self, expression):
+        '''Evaluates a ranking expression over the metric columns.
+
+        Parameters
+        ----------
+        expression : str
+            The ranking expression, eg: 'yield / std'.
+
+        Returns
+        -------
+        scores : numpy array
+            The value of the expression for every ticker.
+        '''
+        return np.asarray(self._evaluate(self._normalize(expression)), dtype=float)
+
+    def screen(self, where=None, rank_by=None, top=None, ascending=False):
+        '''Filters the tickers and ranks the tickers that pass.
+
+        Parameters
+        ----------
+        where : str, optional
+            The filter expression. Every ticker passes if None.
+
+        rank_by : str, optional
+            The ranking expression. Tickers keep their original order if None.
+
+        top : int, optional
+            The number of tickers to return. Every passing ticker is returned
+            if None and no ticker is returned if top is 0 or less.
+
+        ascending : bool
+            Ranks the lowest scores first if True.
+
+        Returns
+        -------
+        screen_df : pandas dataframe
+            The metrics of the selected tickers in rank order with the rank
+            expression in a 'score' column. Tickers whose score is NaN are
+            ranked last.
+        '''
+
+        # A negative top would otherwise slice from the end of the candidates:
+        if top is not None:
+            top = max(top, 0)
+
+        if where is None:
+            candidates = np.arange(len(self.metrics))
+        else:
+            candidates = np.flatnonzero(self.filter(where))
+
+        if rank_by is None:
+            selected = candidates[:top]
+            return self.metrics.iloc[selected]
+
+        scores = self.score(rank_by)[candidates]
+
+        # Sorting keys where the best score is the smallest and NaN is last:
+        keys = scores if ascending else -scores
+        keys = np.where(np.isnan(keys), np.inf, keys)
+
+        # Partially sorting only the top scores before ordering them:
+        if top == 0:
+            partition = np.arange(0)
+        elif top is not None and top < len(keys):
+            partition = np.argpartition(keys, top - 1)[:top]
+        else:
+            partition = np.arange(len(keys))
+
+        ranked = partition[np.argsort(keys[partition], kind='stable')]
+
+        screen_df = self.metrics.iloc[candidates[ranked]].copy()
+        screen_df['score'] = scores[ranked]
+
+        return screen_df
+
+    def _normalize(self, expression):
+        '''Replaces metric aliases with their column names and strips the
+        percent signs from numbers.'''
+        for alias, column in METRIC_ALIASES.items():
+            expression = re.sub(r'\b{}\b'.format(alias), column, expression)
+
+        return re.sub(r'(\d)\s*%', r'\1', expression)
+
+    def _evaluate(self, expression):
+        '''Evaluates an expression vectorially over the metric columns.'''
+        return pd.eval(expression, local_dict=self.columns)
+
+    def _sorted_index(self, column):
+        '''Returns the argsort of a column, its sorted values and the number of
+        values that are not NaN (NaN values are sorted last).'''
+        if column not in self._sorted_indexes:
+            values = self.columns[column]
+            order = np.argsort(values, kind='stable')
+
+            self._sorted_indexes[column] = (order, values[order],
+             int(np.count_nonzero(~np.isnan(values))))
+
+        return self._sorted_indexes[column]
+
+    def _index_lookup(self, column, operator, value):
+        '''Answers 'column operator value' with a binary search of the sorted
+        index of the column.'''
+        order, sorted_values, valid = self._sorted_index(column)
+        sorted_values = sorted_values[:valid]
+
+        left = np.searchsorted(sorted_values, value, side='left')
+        right = np.searchsorted(sorted_values, value, side='right')
+
+        # The range of sorted positions that satisfy the comparison:
+        bounds = {'>': (right, valid), '>=': (left, valid), '<': (0, left),
+         '<=': (0, right), '==': (left, right), '!=': (left, right)}
+        start, stop = bounds[operator]
+
+        mask = np.zeros(len(order), dtype=bool)
+        mask[order[start:stop]] = True
+
+        # != is everything outside of the == range, including NaN as in numpy:
+        if operator == '!=':
+            mask = ~mask
+
+        return mask
@@ -0,0 +1,490 @@
+'''Command line interface for running the dividend comparison jobs.
+
+Example:
+
+    python -m financial_workbook_writing_application compare WM SPY XOM
+    python -m financial_workbook_writing_application fetch --ticker-file universe.txt --workers 8
+    python -m financial_workbook_writing_application export --ticker-file universe.txt --excel dividends.xlsx
+
+The timing of every stage is printed to stderr once the command finishes.
+'''
+# Only lightweight standard library packages are imported at module level so
+# the interface starts quickly. The data packages are imported by the
+# subcommand that needs them:
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+
+# Rough in-memory size of one ticker's raw data and dividend_asset() object,
+# used to convert --memory-budget into the number of tickers held at once:
+TICKER_MEMORY_MB = 2.0
+
+# Rough resident size of one chart rendering worker process, used to convert
+# --memory-budget into the number of rendering processes:
+RENDER_WORKER_MB = 100.0
+
+# Age in seconds after which cached prices are re-fetched, so scheduled runs
+# pick up new prices and splits without a separate fetch:
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache',
+ 'financial_workbook')
+
+class stage_timer(object):
+    """
+    The stage_timer object records the wall clock duration of each stage of a
+    command and prints them as a table.
+
+    Methods
+    -------
+    stage(name)
+        Context manager that times the code run inside it.
+
+    add(name, seconds)
+        Records a duration that was measured elsewhere.
+
+    report(stream)
+        Prints every recorded duration to the stream.
+    """
+
+    def __init__(self):
+        self.timings = []
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        '''Times the body of the with statement as the stage name.'''
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        '''Records the duration of a stage.'''
+        self.timings.append((name, seconds))
+
+    def report(self, stream):
+        '''Prints every recorded stage duration to the stream.'''
+        for name, seconds in self.timings:
+            print('{:<24} {:>10.3f}s'.format(name, seconds), file=stream)
+
+def read_tickers(args):
+    '''Returns the tickers given on the command line followed by the tickers
+    in --ticker-file, without duplicates. The ticker file may separate tickers
+    by newlines or commas and lines starting with '#' are ignored.'''
+    tickers = list(args.tickers)
+
+    if args.ticker_file is not None:
+        with open(args.ticker_file) as ticker_file:
+            for line in ticker_file:
+                line = line.split('#', 1)[0]
+                tickers.extend(ticker.strip() for ticker in line.split(','))
+
+    return list(dict.fromkeys(ticker.upper() for ticker in tickers if ticker))
+
+def budgeted_count(args, default):
+    '''Returns the number of tickers that may be held in memory at once given
+    --memory-budget, or default if no budget was given.'''
+    if args.memory_budget is None:
+        return default
+
+    return max(1, min(default, int(args.memory_budget / TICKER_MEMORY_MB)))
+
+def budgeted_pipeline_sizes(args):
+    '''Returns the (fetch_workers, transform_workers, queue_size) of the
+    dividend_pipeline. Without --memory-budget they are derived from --workers,
+    otherwise they are scaled down together until the tickers held by the
+    workers, both inter-stage queues and the loader fit in the budget, keeping
+    at least one of each.'''
+    fetch_workers = args.workers
+    transform_workers = max(1, args.workers // 2)
+    queue_size = 2 * args.workers
+
+    if args.memory_budget is None:
+        return fetch_workers, transform_workers, queue_size
+
+    # Tickers held at once: one per fetch and transform worker, a full raw and
+    # asset queue, and the one being loaded:
+    capacity = int(args.memory_budget / TICKER_MEMORY_MB) - 1
+    held = fetch_workers + transform_workers + 2 * queue_size
+    scale = min(1.0, max(capacity, 0) / held)
+
+    return (max(1, int(fetch_workers * scale)), max(1, int(transform_workers * scale)),
+     max(1, int(queue_size * scale)))
+
+def budgeted_render_workers(args):
+    '''Returns the number of chart rendering processes given --workers and
+    --memory-budget. At least one process is used.'''
+    if args.memory_budget is None:
+        return args.workers
+
+    return max(1, min(args.workers, int(args.memory_budget / RENDER_WORKER_MB)))
+
+def positive_int(value):
+    '''argparse type of the options that must be an integer of at least 1.'''
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('must be at least 1, got {}'.format(value))
+
+    return number
+
+def build_cache(args):
+    '''Returns the security_data_cache selected by the arguments or None.'''
+    if args.no_cache:
+        return None
+
+    from financial_workbook_writing_application.raw_data_extraction_pkg\
+    .security_data_cache import security_data_cache
+
+    return security_data_cache(args.cache_dir, args.max_age)
+
+def build_provider(cache):
+    '''Returns the yahoo data provider, wrapped by the cache if there is one.'''
+    from financial_workbook_writing_application.raw_data_extraction_pkg\
+    .data_providers import yahoo_data_provider, cached_data_provider
+
+    if cache is None:
+        return yahoo_data_provider()
+
+    return cached_data_provider(yahoo_data_provider(), cache)
+
+def run_pipeline(args, timer):
+    '''Runs every ticker through the dividend_pipeline and returns the
+    dictionary of dividend_asset() objects. Failed tickers are printed to
+    stderr and stored in args.failed.'''
+
+    with timer.stage('import'):
+        from financial_workbook_writing_application.data_transformation_pkg\
+        .dividend_pipeline import dividend_pipeline
+
+        cache = build_cache(args)
+        provider = build_provider(cache)
+
+    fetch_workers, transform_workers, queue_size = budgeted_pipeline_sizes(args)
+    pipeline = dividend_pipeline(provider, fetch_workers=fetch_workers,
+     transform_workers=transform_workers, queue_size=queue_size, cache=cache)
+
+    with timer.stage('pipeline'):
+        asset_dict = pipeline.process(args.ticker_list)
+
+    # Cumulative time spent by the workers of each pipeline stage:
+    for stage, seconds in pipeline.stage_timings.items():
+        timer.add('  ' + stage + ' (busy)', seconds)
+
+    report_errors(args, pipeline.errors)
+
+    return asset_dict
+
+def report_errors(args, errors):
+    '''Prints each failed ticker to stderr and records it in args.failed.'''
+    for ticker, error in errors.items():
+        print('{}: {}: {}'.format(ticker, type(error).__name__, error), file=sys.stderr)
+
+    args.failed.update(errors)
+
+def build_comparison(args, timer):
+    '''Runs the pipeline and aggregates its output into a
+    div_asset_comparison() object.'''
+    asset_dict = run_pipeline(args, timer)
+
+    with timer.stage('aggregate'):
+        from financial_workbook_writing_application.data_transformation_pkg\
+        .dividend_data_transformation import div_asset_comparison
+
+        comparison = div_asset_comparison(dividend_assets=asset_dict.values())
+
+    return comparison
+
+def render_charts(args, timer, asset_dict):
+    '''Renders the normality charts of every ticker into --charts and returns
+    the renderer.'''
+
+    with timer.stage('render'):
+        from financial_workbook_writing_application.statistical_data_validation_pkg\
+        .normality_chart_rendering import normality_chart_renderer
+
+        workers = budgeted_render_workers(args)
+        renderer = normality_chart_renderer(args.charts, formats=args.chart_format,
+         workers=workers, alpha=args.alpha, timeout=args.chart_timeout,
+         max_in_flight=budgeted_count(args, 2 * workers))
+        renderer.render({ticker: asset.annual_div_yields for ticker, asset
+         in asset_dict.items()})
+
+    report_errors(args, renderer.errors)
+
+    return renderer
+
+def write_frame(args, frame):
+    '''Writes a dataframe to --output (or stdout) in the --format.'''
+    stream = sys.stdout if args.output is None else open(args.output, 'w')
+
+    try:
+        if args.format == 'csv':
+            frame.to_csv(stream)
+        elif args.format == 'json':
+            stream.write(frame.to_json(orient='split', date_format='iso'))
+            stream.write('\n')
+        else:
+            stream.write(frame.to_string())
+            stream.write('\n')
+
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+def cmd_fetch(args, timer):
+    '''Fetches every ticker from the web into the cache, replacing any cached
+    raw data, and updates its corporate action adjustment factors.'''
+
+    if args.no_cache:
+        raise SystemExit('fetch requires a cache, remove --no-cache')
+
+    with timer.stage('import'):
+        from financial_workbook_writing_application.data_transformation_pkg\
+        .corporate_actions import load_corporate_actions
+        from concurrent.futures import ThreadPoolExecutor
+        import pandas as pd
+
+        cache = build_cache(args)
+        provider = build_provider(cache)
+
+    def warm(ticker):
+        raw_data = provider.refresh(ticker)
+        split_history = raw_data.get('split_history', pd.Series(dtype=float))
+        load_corporate_actions(ticker, raw_data['historical_prices'],
+         split_history, cache, raw_data.get('split_adjusted', True))
+
+    # Each worker holds one ticker in memory while it is being cached:
+    workers = budgeted_count(args, args.workers)
+    errors = {}
+
+    with timer.stage('fetch'):
+        with ThreadPoolExecutor(workers) as executor:
+            futures = {ticker: executor.submit(warm, ticker) for ticker in args.ticker_list}
+
+            for ticker, future in futures.items():
+                try:
+                    future.result()
+                except Exception as error:
+                    errors[ticker] = error
+
+    report_errors(args, errors)
+    print('Cached {} of {} tickers in {}'.format(len(args.ticker_list) - len(errors),
+     len(args.ticker_list), args.cache_dir))
+
+def cmd_compare(args, timer):
+    '''Prints one of the comparison dataframes.'''
+    comparison = build_comparison(args, timer)
+
+    with timer.stage('output'):
+        if args.metric == 'yields':
+            frame = comparison.annual_div_yields
+        elif args.metric == 'pct_change':
+            frame = comparison.ticker_pct_change
+        else:
+            from financial_workbook_writing_application.excel_data_loading_pkg\
+            .dividend_etf_workbook import build_summary_df
+
+            frame = build_summary_df(comparison)
+
+        write_frame(args, frame)
+
+def cmd_validate(args, timer):
+    '''Prints the statistical normality test results of each ticker's annual
+    dividend yields and optionally renders the visual tests.'''
+    asset_dict = run_pipeline(args, timer)
+
+    with timer.stage('validate'):
+        from financial_workbook_writing_application.statistical_data_validation_pkg\
+        .normality_testing import normality_validation, Data_Validation_Warning
+        import pandas as pd
+        import warnings
+
+        # The results are printed so the per ticker warnings are suppressed:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', Data_Validation_Warning)
+
+            summary_dict = {ticker: normality_validation(asset.annual_div_yields,
+             args.alpha, False).summary_df for ticker, asset in asset_dict.items()}
+
+    if args.charts is not None:
+        render_charts(args, timer, asset_dict)
+
+    with timer.stage('output'):
+        if summary_dict:
+            write_frame(args, pd.concat(summary_dict, names=['ticker', 'test']))
+
+def cmd_export(args, timer):
+    '''Loads the comparison into an excel workbook and/or a sqlite database.'''
+
+    if args.excel is None and args.database is None:
+        raise SystemExit('export requires --excel and/or --database')
+
+    if args.excel is not None and args.charts is not None and 'png' not in args.chart_format:
+        raise SystemExit("embedding charts in --excel requires 'png' in --chart-format")
+
+    comparison = build_comparison(args, timer)
+
+    renderer = None
+    if args.charts is not None:
+        renderer = render_charts(args, timer, comparison.ticker_dict)
+
+    with timer.stage('import'):
+        from financial_workbook_writing_application.excel_data_loading_pkg\
+        .dividend_etf_workbook import dividend_etf_workbook,\
+         write_comparison_to_database
+
+    if args.excel is not None:
+        with timer.stage('export excel'):
+            dividend_etf_workbook(comparison, renderer).write(args.excel)
+
+    if args.database is not None:
+        with timer.stage('export database'):
+            write_comparison_to_database(comparison, args.database)
+
+def cmd_screen(args, timer):
+    '''Prints the tickers that pass a filter expression, ranked by a ranking
+    expression.'''
+    asset_dict = run_pipeline(args, timer)
+
+    with timer.stage('screen'):
+        from financial_workbook_writing_application.data_transformation_pkg\
+        .dividend_screening import build_screening_metrics, dividend_screener
+
+        screener = dividend_screener(build_screening_metrics(asset_dict.values()))
+        screen_df = screener.screen(args.where, args.rank_by, args.top, args.ascending)
+
+    with timer.stage('output'):
+        write_frame(args, screen_df)
+
+def cmd_calendar(args, timer):
+    '''Prints the forward dividend calendar of every ticker.'''
+    asset_dict = run_pipeline(args, timer)
+
+    with timer.stage('calendar'):
+        from financial_workbook_writing_application.data_transformation_pkg\
+        .dividend_schedule import build_dividend_calendar
+
+        calendar_df = build_dividend_calendar([asset.payment_schedule for asset
+         in asset_dict.values()], args.start, args.end)
+
+    with timer.stage('output'):
+        write_frame(args, calendar_df.set_index('ex_date'))
+
+def cmd_benchmark(args, timer):
+    '''Runs the pipeline --repeat times and reports the throughput of each run.
+    Runs after the first are served from the cache unless --no-cache is set.'''
+
+    for run in range(args.repeat):
+        start = time.perf_counter()
+        asset_dict = run_pipeline(args, timer)
+        seconds = time.perf_counter() - start
+
+        print('run {}: {} tickers in {:.3f}s ({:.1f} tickers/s)'.format(run + 1,
+         len(asset_dict), seconds, len(asset_dict) / seconds if seconds else 0.0))
+
+def build_parser():
+    '''Builds the argument parser of every subcommand.'''
+
+    # Options shared by every subcommand:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('tickers', nargs='*', help='ticker symbols to process')
+    common.add_argument('--ticker-file', help='file of ticker symbols, one per line or comma separated')
+    common.add_argument('--workers', type=positive_int, default=4, help='number of concurrent workers (default: 4)')
+    common.add_argument('--memory-budget', type=float, metavar='MB',
+     help='approximate memory budget in megabytes. It caps the tickers held by the '
+     'pipeline workers and queues (~{:g} MB each) and the chart rendering processes '
+     '(~{:g} MB each), not the finished results'.format(TICKER_MEMORY_MB, RENDER_WORKER_MB))
+    common.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='directory of the price cache')
+    common.add_argument('--max-age', type=float, default=DEFAULT_MAX_AGE, metavar='SECONDS',
+     help='re-fetch cached tickers older than this (default: one day). fetch always re-fetches')
+    common.add_argument('--no-cache', action='store_true', help='always fetch from the web')
+    common.add_argument('--no-timings', action='store_true', help='do not print stage timings')
+
+    # Options of the subcommands that write a dataframe:
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--format', choices=('table', 'csv', 'json'), default='table')
+    output.add_argument('--output', help='file to write to instead of stdout')
+
+    # Options of the subcommands that render charts:
+    charts = argparse.ArgumentParser(add_help=False)
+    charts.add_argument('--charts', metavar='DIR', help='render the normality charts into DIR')
+    charts.add_argument('--chart-format', nargs='+', choices=('png', 'svg'), default=['png'])
+    charts.add_argument('--alpha', type=float, default=0.05, help='significance level of the normality tests')
+    charts.add_argument('--chart-timeout', type=float, default=60.0, metavar='SECONDS',
+     help='seconds a ticker\'s charts may take to render before its worker is killed')
+
+    parser = argparse.ArgumentParser(prog='financial_workbook_writing_application',
+     description='Dividend comparison workbook jobs.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fetch = subparsers.add_parser('fetch', parents=[common], help='fetch tickers into the cache')
+    fetch.set_defaults(func=cmd_fetch)
+
+    compare = subparsers.add_parser('compare', parents=[common, output],
+     help='compare the dividend yields of the tickers')
+    compare.add_argument('--metric', choices=('yields', 'pct_change', 'summary'), default='yields')
+    compare.set_defaults(func=cmd_compare)
+
+    validate = subparsers.add_parser('validate', parents=[common, output, charts],
+     help='test the annual dividend yields for normality')
+    validate.set_defaults(func=cmd_validate)
+
+    export = subparsers.add_parser('export', parents=[common, charts],
+     help='export the comparison to excel and/or a database')
+    export.add_argument('--excel', metavar='PATH', help='xlsx workbook to write')
+    export.add_argument('--database', metavar='PATH', help='sqlite database to write')
+    export.set_defaults(func=cmd_export)
+
+    screen = subparsers.add_parser('screen', parents=[common, output],
+     help='filter and rank the tickers on their dividend metrics')
+    screen.add_argument('--where', help="filter expression, eg: 'yield > 3%% and drawdown < 1'")
+    screen.add_argument('--rank-by', help="ranking expression, eg: 'yield / std'")
+    screen.add_argument('--top', type=int, help='number of tickers to return')
+    screen.add_argument('--ascending', action='store_true', help='rank the lowest scores first')
+    screen.set_defaults(func=cmd_screen)
+
+    calendar = subparsers.add_parser('calendar', parents=[common, output],
+     help='forecast the dividend payments of the tickers')
+    calendar.add_argument('--start', help='first date of the calendar (default: today)')
+    calendar.add_argument('--end', help='last date of the calendar (default: one year after --start)')
+    calendar.set_defaults(func=cmd_calendar)
+
+    benchmark = subparsers.add_parser('benchmark', parents=[common],
+     help='time repeated pipeline runs')
+    benchmark.add_argument('--repeat', type=positive_int, default=3)
+    benchmark.set_defaults(func=cmd_benchmark)
+
+    return parser
+
+def main(argv=None):
+    '''Runs the command line interface.
+
+    Returns
+    -------
+    exit_code : int
+        0 if every ticker succeeded, 1 if any ticker failed.
+    '''
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    args.ticker_list = read_tickers(args)
+    if not args.ticker_list:
+        parser.error('no tickers given')
+
+    args.failed = {}
+    timer = stage_timer()
+
+    try:
+        with timer.stage('total'):
+            args.func(args, timer)
+
+    finally:
+        if not args.no_timings:
+            timer.report(sys.stderr)
+
+    return 1 if args.failed else 0
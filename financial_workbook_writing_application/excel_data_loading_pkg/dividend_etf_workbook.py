@@ -0,0 +1,109 @@
+# Importing data management packages:
+import pandas as pd
+# Misc packages imports:
+import sqlite3
+
+
+class dividend_etf_workbook(object):
+    """
+    The dividend_etf_workbook object loads the dataframes produced by a
+    div_asset_comparison() object into an excel workbook, one comparison per
+    worksheet. If a normality_chart_renderer() has rendered the charts of the
+    compared tickers they are embedded in a seperate worksheet.
+
+    Methods
+    -------
+    write(path)
+        Writes the workbook to the path.
+    """
+
+    def __init__(self, comparison, chart_renderer=None):
+        """
+        Parameters
+        ----------
+        comparison : div_asset_comparison
+            The comparison object whose dataframes are written to the workbook.
+
+        chart_renderer : normality_chart_renderer, optional
+            A renderer that has already rendered PNG charts for the tickers in
+            the comparison.
+        """
+        self.comparison = comparison
+        self.chart_renderer = chart_renderer
+
+    def write(self, path):
+        '''Writes every comparison dataframe, and any rendered charts, to an
+        xlsx workbook.
+
+        Parameters
+        ----------
+        path : str
+            The path of the xlsx file to write.
+        '''
+
+        with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
+
+            self.comparison.annual_div_yields.to_excel(writer,
+             sheet_name='Annual Dividend Yields')
+            self.comparison.ticker_pct_change.to_excel(writer,
+             sheet_name='Dividend Yield % Change')
+            build_summary_df(self.comparison).to_excel(writer,
+             sheet_name='Dividend Summary')
+
+            if self.chart_renderer is not None:
+                worksheet = writer.book.add_worksheet('Normality Tests')
+
+                # Placing the charts of each ticker on their own block of rows:
+                for position, ticker in enumerate(self.chart_renderer.manifest):
+                    worksheet.write(position * 22, 0, ticker)
+                    self.chart_renderer.embed_in_worksheet(worksheet, ticker,
+                     row=position * 22 + 1, col=0)
+
+def build_summary_df(comparison):
+    '''Builds a dataframe of the single value metrics of each ticker in a
+    div_asset_comparison() object.
+
+    Parameters
+    ----------
+    comparison : div_asset_comparison
+        The comparison object to summarize.
+
+    Returns
+    -------
+    summary_df : pandas dataframe
+        The dataframe of the dividend yield standard deviation and maximum
+        annual drawdown indexed by ticker.
+    '''
+    summary_df = pd.DataFrame({'divided_std': comparison.ticker_std,
+     'max_annual_drawdown': comparison.max_annual_drawdown})
+    summary_df.index.name = 'ticker'
+
+    return summary_df
+
+def write_comparison_to_database(comparison, database_path):
+    '''Loads the dataframes of a div_asset_comparison() object into a sqlite
+    database, replacing any existing tables of the same name.
+
+    Parameters
+    ----------
+    comparison : div_asset_comparison
+        The comparison object whose dataframes are written.
+
+    database_path : str
+        The path of the sqlite database file.
+    '''
+
+    connection = sqlite3.connect(database_path)
+
+    try:
+        comparison.annual_div_yields.to_sql('annual_div_yields', connection,
+         if_exists='replace', index_label='year')
+        comparison.ticker_pct_change.to_sql('div_yield_pct_change', connection,
+         if_exists='replace', index_label='year')
+        build_summary_df(comparison).to_sql('dividend_summary', connection,
+         if_exists='replace')
+
+        connection.commit()
+
+    finally:
+        connection.close()
@@ -0,0 +1,150 @@
+# Path hack:
+import sys
+sys.path.append('..')
+
+# Importing the raw web data fetching function:
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.web_based_financial_models import fetch_raw_data
+
+
+class yahoo_data_provider(object):
+    """
+    The yahoo_data_provider object is the default source of raw data for the
+    asynchronous data pipeline. It wraps fetch_raw_data() so that the raw
+    web data for a ticker can be fetched independently of the construction
+    of the Security object.
+
+    Methods
+    -------
+    fetch(ticker)
+        Returns the raw data dictionary for a ticker from yahoo finance.
+    """
+
+    def fetch(self, ticker):
+        '''Fetches the raw data for a single ticker. This method performs
+        blocking network I/O and is run in a worker thread by the pipeline.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to fetch.
+
+        Returns
+        -------
+        raw_data : dict
+            {historical_prices, dividend_history, split_history, title}
+        '''
+        return fetch_raw_data(ticker)
+
+class in_memory_data_provider(object):
+    """
+    The in_memory_data_provider object serves raw data dictionaries that are
+    already held in memory. It performs no network I/O and is used to replay
+    previously fetched data through the pipeline or to drive the pipeline
+    with fabricated data in tests.
+
+    Methods
+    -------
+    fetch(ticker)
+        Returns the stored raw data dictionary for a ticker.
+    """
+
+    def __init__(self, raw_data_dict):
+        """
+        Parameters
+        ----------
+        raw_data_dict : dict
+            A dictionary of raw data dictionaries indexed by ticker symbol:
+
+            {ticker: {historical_prices, dividend_history, split_history, title}}
+        """
+        self.raw_data_dict = raw_data_dict
+
+    def fetch(self, ticker):
+        '''Returns the raw data stored for the ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to fetch.
+
+        Returns
+        -------
+        raw_data : dict
+            {historical_prices, dividend_history, split_history, title}
+
+        Raises
+        ------
+        KeyError
+            If no raw data is stored for the ticker.
+        '''
+        return self.raw_data_dict[ticker]
+
+class cached_data_provider(object):
+    """
+    The cached_data_provider object wraps another provider with a
+    security_data_cache. Tickers found in the cache are served from disk and
+    every other ticker is fetched from the wrapped provider and then cached.
+
+    Methods
+    -------
+    fetch(ticker)
+        Returns the cached raw data of a ticker, fetching it if necessary.
+
+    refresh(ticker)
+        Fetches the raw data of a ticker and replaces its cached raw data.
+    """
+
+    def __init__(self, provider, cache):
+        """
+        Parameters
+        ----------
+        provider : object
+            The provider used for tickers that are not cached, eg:
+            yahoo_data_provider().
+
+        cache : security_data_cache
+            The cache the raw data is read from and written to.
+        """
+        self.provider = provider
+        self.cache = cache
+
+    def fetch(self, ticker):
+        '''Returns the raw data of a ticker from the cache or, if it is not
+        cached, from the wrapped provider.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to fetch.
+
+        Returns
+        -------
+        raw_data : dict
+            {historical_prices, dividend_history, split_history, title}
+        '''
+        raw_data = self.cache.load_raw_data(ticker)
+
+        if raw_data is None:
+            raw_data = self.refresh(ticker)
+
+        return raw_data
+
+    def refresh(self, ticker):
+        '''Fetches the raw data of a ticker from the wrapped provider, ignoring
+        the cache, and writes it to the cache.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to fetch.
+
+        Returns
+        -------
+        raw_data : dict
+            {historical_prices, dividend_history, split_history, title}
+        '''
+        raw_data = self.provider.fetch(ticker)
+        self.cache.store_raw_data(ticker, raw_data)
+
+        return raw_data
@@ -0,0 +1,133 @@
+# Importing data management packages:
+import pandas as pd
+# Misc packages imports:
+import os
+import threading
+import time
+
+
+class security_data_cache(object):
+    """
+    The security_data_cache object stores the raw data of each ticker on disk
+    so that repeated runs do not re-fetch it from the web. The corporate action
+    adjustment factors computed from that data are stored alongside it so they
+    only have to be updated when new data arrives.
+
+    Each ticker is stored as pickle files in the cache directory:
+
+    {ticker}_raw_data.pkl, {ticker}_adjustments.pkl
+
+    Methods
+    -------
+    load_raw_data(ticker)
+        Returns the cached raw data dictionary of a ticker or None.
+
+    store_raw_data(ticker, raw_data)
+        Writes the raw data dictionary of a ticker to the cache.
+
+    load_adjustments(ticker)
+        Returns the cached adjustment factor data of a ticker or None.
+
+    store_adjustments(ticker, adjustment_data)
+        Writes the adjustment factor data of a ticker to the cache.
+    """
+
+    def __init__(self, cache_dir, max_age=None):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            The directory the cache files are stored in. It is created if it
+            does not exist.
+
+        max_age : float, optional
+            The age in seconds after which cached raw data is considered stale
+            and is no longer returned. Cached data never expires if None.
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def load_raw_data(self, ticker):
+        '''Loads the cached raw data of a ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to load.
+
+        Returns
+        -------
+        raw_data : dict or None
+            {historical_prices, dividend_history, split_history, title} or None
+            if the ticker is not cached or the cached data is stale.
+        '''
+        path = self._path(ticker, 'raw_data')
+
+        if not os.path.exists(path):
+            return None
+
+        if self.max_age is not None and time.time() - os.path.getmtime(path) > self.max_age:
+            return None
+
+        return pd.read_pickle(path)
+
+    def store_raw_data(self, ticker, raw_data):
+        '''Writes the raw data of a ticker to the cache.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to store.
+
+        raw_data : dict
+            {historical_prices, dividend_history, split_history, title}
+        '''
+        self._write(self._path(ticker, 'raw_data'), raw_data)
+
+    def load_adjustments(self, ticker):
+        '''Loads the cached corporate action adjustment factor data of a ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to load.
+
+        Returns
+        -------
+        adjustment_data : dict or None
+            The dictionary produced by corporate_action_adjustments.to_cache()
+            or None if the ticker has no cached factors.
+        '''
+        path = self._path(ticker, 'adjustments')
+
+        if not os.path.exists(path):
+            return None
+
+        return pd.read_pickle(path)
+
+    def store_adjustments(self, ticker, adjustment_data):
+        '''Writes the corporate action adjustment factor data of a ticker to
+        the cache.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol to store.
+
+        adjustment_data : dict
+            The dictionary produced by corporate_action_adjustments.to_cache()
+        '''
+        self._write(self._path(ticker, 'adjustments'), adjustment_data)
+
+    def _path(self, ticker, kind):
+        '''Returns the path of a cache file.'''
+        return os.path.join(self.cache_dir, '{}_{}.pkl'.format(ticker, kind))
+
+    def _write(self, path, data):
+        '''Writes to a temporary file first so a reader never sees a partially
+        written cache file.'''
+        temp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), threading.get_ident())
+        pd.to_pickle(data, temp_path)
+        os.replace(temp_path, path)
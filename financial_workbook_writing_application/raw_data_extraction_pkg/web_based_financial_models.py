@@ -17,6 +17,43 @@ sns.set() # Setting all charts to seaborn style
 yf.pdr_override() # overiding pdr with yfinance packages
 
 
+def fetch_raw_data(ticker):
+    '''Fetches all of the raw web data needed to construct a Security object
+    without performing any of the transformations. This allows the blocking
+    network I/O to be seperated from the construction of the Security.
+
+    Parameters
+    ----------
+    ticker : str
+        The ticker symbol of the Security to be fetched.
+
+    Returns
+    -------
+    raw_data : dict
+        A dictionary containing the raw data for the ticker:
+
+        {historical_prices, dividend_history, split_history, title, split_adjusted}
+
+        Yahoo finance reports prices and dividends that are already split
+        adjusted, which is recorded by split_adjusted = True.
+    '''
+
+    # Start/end date for pandas_datareader:
+    start = datetime.datetime(1970, 1, 1) # Arbitrary start date
+    end = datetime.datetime.today()
+
+    # Pricing data and yfinance fundemental data:
+    historical_prices = pdr.get_data_yahoo(ticker, start, end)
+    yFinance_object = yf.Ticker(ticker)
+
+    raw_data = {'historical_prices': historical_prices,
+                'dividend_history': yFinance_object.dividends,
+                'split_history': yFinance_object.splits,
+                'title': yFinance_object.info['shortName'],
+                'split_adjusted': True}
+
+    return raw_data
+
 class Security(object):
     '''
     The Security object contains descriptive variables for each Security instance as well
@@ -30,20 +67,44 @@ class Security(object):
     ticker : str
         The string variable representing the ticker symbol for the Security. This
         string is the argument that is passed to all the data aggregation methods
+    raw_data : dict, optional
+        A dictionary of pre-fetched raw data as returned by fetch_raw_data().
+        When provided no web requests are made and the Security is built
+        entirely from the dictionary:
+
+        {historical_prices, dividend_history, split_history, title, split_adjusted}
+
+        split_adjusted is optional and defaults to True (the basis of yahoo
+        finance data).
     '''
-    def __init__(self, ticker):
+    def __init__(self, ticker, raw_data=None):
 
         # Declaring instance variables:
         self.ticker = ticker
-        self.historical_prices = self.Price()
-        self.price = round(self.historical_prices.iloc[-1]['Adj Close'], 2)
 
-        # creating instance variable to store yfinance object:
-        self.yFinance_object = yf.Ticker(self.ticker)
+        if raw_data is None:
+            self.historical_prices = self.Price()
+
+            # creating instance variable to store yfinance object:
+            self.yFinance_object = yf.Ticker(self.ticker)
+
+            # Storing specific instance variables forom yfinance object:
+            self.dividend_history = self.yFinance_object.dividends
+            self.split_history = self.yFinance_object.splits
+            self.title = self.yFinance_object.info['shortName']
+            self.split_adjusted = True # Yahoo finance data is split adjusted
 
-        # Storing specific instance variables forom yfinance object:
-        self.dividend_history = self.yFinance_object.dividends
-        self.title = self.yFinance_object.info['shortName']
+        else:
+            # Building the Security from data that has already been fetched:
+            self.historical_prices = raw_data['historical_prices']
+            self.yFinance_object = None
+            self.dividend_history = raw_data['dividend_history']
+            self.split_history = raw_data.get('split_history',
+             pd.Series(dtype=float, name='Stock Splits'))
+            self.title = raw_data['title']
+            self.split_adjusted = raw_data.get('split_adjusted', True)
+
+        self.price = round(self.historical_prices.iloc[-1]['Adj Close'], 2)
 
         # Storing the historical returns dataframe:
         self.returns = self.returns()
@@ -73,19 +134,30 @@ class Security(object):
         price = pdr.get_data_yahoo(self.ticker, start, end)
         return price
 
+    def return_prices(self):
+        '''Method that returns the price series the historical returns are
+            calculated from. Subclasses override it to restate returns on
+            another basis.
+        Returns
+        -------
+        return_prices : pandas series
+            The historical Adj Close price of the ticker
+        '''
+        return self.historical_prices['Adj Close']
+
     def returns(self):
-        '''Method that takes the historical Adj Close price and converts it into
-            a percent return on investment
+        '''Method that takes the price series of return_prices() and converts it
+            into a percent return on investment
         Returns
         -------
         Returns_df : pandas dataframe
             Dataframe containing the historical percent ROI for the ticker
         '''
+        prices = self.return_prices()
         Returns_df = pd.DataFrame()
 
         # Creating column:
-        Returns_df[self.ticker] = (self.historical_prices['Adj Close']).apply(
-        lambda x : ((x - self.historical_prices['Adj Close'][0])) / self.historical_prices['Adj Close'][0])
+        Returns_df[self.ticker] = (prices - prices.iloc[0]) / prices.iloc[0]
 
         return Returns_df
 
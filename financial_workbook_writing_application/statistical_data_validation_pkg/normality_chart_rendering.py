@@ -0,0 +1,335 @@
+# Path hack:
+import sys
+sys.path.append('..')
+
+# Importing the normality tests and shared drawing functions:
+from financial_workbook_writing_application.statistical_data_validation_pkg\
+.normality_testing import normality_validation, Data_Validation_Warning,\
+ plot_histogram, plot_qq, plot_summary_table
+
+# Importing the non-interactive matplotlib objects:
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+# Importing concurrency packages:
+import multiprocessing
+import collections
+# Misc packages imports:
+import os
+import time
+import warnings
+
+
+# The charts rendered for every ticker, in the order they are embedded:
+CHART_TYPES = ('histogram', 'qq_plot', 'summary_table')
+
+# Figure templates owned by the current process. They are built once per worker
+# and cleared between tickers instead of building a new figure for every chart:
+_templates = None
+
+def _build_templates(figsize, dpi):
+    '''Builds one Agg backed Figure and Axes per chart type. The figures are
+    never registered with pyplot so they cannot leak into its figure manager.
+    '''
+    templates = {}
+
+    for chart in CHART_TYPES:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+
+        templates[chart] = (fig, ax)
+
+    return templates
+
+def _init_worker(figsize, dpi):
+    '''Initalizes a rendering worker process with the Agg backend and its own
+    figure templates.'''
+    global _templates
+
+    matplotlib.use('Agg', force=True)
+    _templates = _build_templates(figsize, dpi)
+
+def _render_ticker(ticker, data, alpha, output_dir, formats):
+    '''Renders the histogram, Q-Q plot and summary table of a single ticker
+    to files using the figure templates of the current process.
+
+    Returns
+    -------
+    path_dict : dict
+        A dictionary of the file paths written for each chart type:
+
+        {histogram: [paths], qq_plot: [paths], summary_table: [paths]}
+    '''
+
+    # Naming the data so the chart titles refer to the ticker:
+    if data.name is None:
+        data = data.rename(ticker)
+
+    # The test results are drawn in the summary table so the warnings that
+    # normality_validation raises would only be noise in a batch job:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', Data_Validation_Warning)
+        summary_df = normality_validation(data, alpha, False).summary_df
+
+    path_dict = {}
+
+    for chart in CHART_TYPES:
+        fig, ax = _templates[chart]
+
+        try:
+            if chart == 'histogram':
+                plot_histogram(ax, data)
+            elif chart == 'qq_plot':
+                plot_qq(ax, data)
+            else:
+                plot_summary_table(ax, summary_df)
+
+            path_dict[chart] = []
+            for fmt in formats:
+                path = os.path.join(output_dir, '{}_{}.{}'.format(ticker, chart, fmt))
+                fig.savefig(path, format=fmt, bbox_inches='tight')
+                path_dict[chart].append(path)
+
+        finally:
+            # Resetting the template so no artists are held between tickers:
+            ax.clear()
+
+    return path_dict
+
+class normality_chart_renderer(object):
+    """
+    The normality_chart_renderer object renders the visual normality tests of
+    many tickers to image files without a display. Charts are drawn with the
+    object-oriented Figure API on the Agg backend in a pool of worker
+    processes, each of which reuses one figure template per chart type.
+
+    Methods
+    -------
+    render(data_dict)
+        Renders the histogram, Q-Q plot and summary table of every ticker
+        and returns the paths of the files written.
+
+    embed_in_worksheet(worksheet, ticker, row, col)
+        Inserts the rendered PNG charts of a ticker into an xlsxwriter
+        worksheet.
+    """
+
+    def __init__(self, output_dir, formats=('png',), workers=None, alpha=0.05,
+     figsize=(6, 4), dpi=100, max_in_flight=None, max_tasks_per_child=100,
+     timeout=60.0):
+        """
+        Parameters
+        ----------
+        output_dir : str
+            The directory the chart files are written to. It is created if it
+            does not exist.
+
+        formats : tuple
+            The file formats written for every chart, eg: ('png', 'svg').
+
+        workers : int, optional
+            The number of worker processes. Defaults to the cpu count. If 0
+            the charts are rendered serially in the calling process.
+
+        alpha : float
+            The level of significance for the statistical tests drawn in the
+            summary table.
+
+        figsize : tuple
+            The size of each chart in inches.
+
+        dpi : int
+            The resolution of the raster charts.
+
+        max_in_flight : int, optional
+            The maximum number of tickers submitted to the pool at once, which
+            bounds the memory held by pending work. Defaults to twice the
+            number of workers.
+
+        max_tasks_per_child : int, optional
+            The number of tickers a worker process renders before it is
+            replaced, which bounds the memory any single worker can grow to.
+
+        timeout : float, optional
+            The number of seconds after its submission to the pool that the
+            charts of a single ticker must be rendered within. A ticker that
+            times out is recorded in self.errors as a TimeoutError and the pool
+            is replaced so the stuck worker is killed. If None tickers are
+            waited on indefinitely. It does not apply to serial rendering.
+        """
+
+        # Declaring instance variables:
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.workers = os.cpu_count() if workers is None else workers
+        self.alpha = alpha
+        self.figsize = figsize
+        self.dpi = dpi
+        self.max_in_flight = max_in_flight or max(1, self.workers) * 2
+        self.max_tasks_per_child = max_tasks_per_child
+        self.timeout = timeout
+
+        # Instance variables that are populated by each render:
+        self.manifest = {}
+        self.errors = {}
+
+    def render(self, data_dict):
+        '''Renders the visual normality tests of every ticker to files in
+        self.output_dir.
+
+        Parameters
+        ----------
+        data_dict : dict
+            A dictionary of Pandas Series (eg: dividend_asset().annual_div_yields)
+            indexed by ticker.
+
+        Returns
+        -------
+        manifest : dict
+            A dictionary of the files written for each ticker:
+
+            {ticker: {histogram: [paths], qq_plot: [paths], summary_table: [paths]}}
+        '''
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Resetting the per-render instance variables:
+        self.manifest = {}
+        self.errors = {}
+
+        if self.workers == 0:
+            self._render_serial(data_dict)
+        else:
+            self._render_parallel(data_dict)
+
+        return self.manifest
+
+    def embed_in_worksheet(self, worksheet, ticker, row=0, col=0, col_step=10):
+        '''Inserts the rendered PNG charts of a ticker side by side into an
+        xlsxwriter worksheet. render() must have been called first.
+
+        Parameters
+        ----------
+        worksheet : xlsxwriter.worksheet.Worksheet
+            The worksheet the charts are inserted into.
+
+        ticker : str
+            The ticker whose charts are inserted.
+
+        row : int
+            The zero indexed row of the top left cell of the first chart.
+
+        col : int
+            The zero indexed column of the top left cell of the first chart.
+
+        col_step : int
+            The number of columns between the left edge of each chart.
+
+        Raises
+        ------
+        ValueError
+            If 'png' is not one of self.formats, as xlsxwriter can only embed
+            the raster charts.
+        '''
+
+        if 'png' not in self.formats:
+            raise ValueError("charts can only be embedded if 'png' is one of the "
+             "renderer formats, got {}".format(self.formats))
+
+        for position, chart in enumerate(CHART_TYPES):
+            png_paths = [path for path in self.manifest[ticker][chart]
+             if path.endswith('.png')]
+
+            worksheet.insert_image(row, col + position * col_step, png_paths[0])
+
+    def _render_serial(self, data_dict):
+        '''Renders every ticker in the calling process.'''
+
+        global _templates
+        if _templates is None:
+            _templates = _build_templates(self.figsize, self.dpi)
+
+        for ticker, data in data_dict.items():
+            try:
+                self.manifest[ticker] = _render_ticker(ticker, data, self.alpha,
+                 self.output_dir, self.formats)
+
+            except Exception as error:
+                self.errors[ticker] = error
+
+    def _render_parallel(self, data_dict):
+        '''Renders every ticker in a pool of worker processes, keeping at most
+        self.max_in_flight tickers submitted at any time. A ticker that is not
+        rendered within self.timeout seconds of its submission is recorded as a
+        TimeoutError, the pool is replaced to kill the stuck worker and the
+        other pending tickers are resubmitted to the new pool.'''
+
+        tickers = iter(data_dict.items())
+        pending = collections.deque()
+        pool = self._start_pool()
+
+        try:
+            while True:
+                # Submitting tickers until the in flight limit is reached:
+                while len(pending) < self.max_in_flight:
+                    item = next(tickers, None)
+                    if item is None:
+                        break
+                    pending.append(self._submit(pool, *item))
+
+                if not pending:
+                    break
+
+                # Waiting for the oldest ticker until its deadline:
+                ticker, data, async_result, deadline = pending.popleft()
+                async_result.wait(None if deadline is None else
+                 max(deadline - time.monotonic(), 0.0))
+
+                if async_result.ready():
+                    self._collect(ticker, async_result)
+                    continue
+
+                self.errors[ticker] = TimeoutError('{} was not rendered within {} '
+                 'seconds'.format(ticker, self.timeout))
+
+                # Collecting the finished tickers before the pool is replaced:
+                resubmit = []
+                for ticker, data, async_result, deadline in pending:
+                    if async_result.ready():
+                        self._collect(ticker, async_result)
+                    else:
+                        resubmit.append((ticker, data))
+
+                pool.terminate()
+                pool = self._start_pool()
+                pending = collections.deque(self._submit(pool, ticker, data)
+                 for ticker, data in resubmit)
+
+        finally:
+            # Every result has been collected at this point so the workers are
+            # terminated rather than joined:
+            pool.terminate()
+
+    def _start_pool(self):
+        '''Starts a pool of rendering worker processes.'''
+        return multiprocessing.Pool(self.workers, initializer=_init_worker,
+         initargs=(self.figsize, self.dpi), maxtasksperchild=self.max_tasks_per_child)
+
+    def _submit(self, pool, ticker, data):
+        '''Submits a ticker to the pool and returns the pending item with the
+        deadline of the ticker.'''
+        async_result = pool.apply_async(_render_ticker,
+         (ticker, data, self.alpha, self.output_dir, self.formats))
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+        return ticker, data, async_result, deadline
+
+    def _collect(self, ticker, async_result):
+        '''Stores the result or error of a finished ticker.'''
+
+        try:
+            self.manifest[ticker] = async_result.get()
+
+        except Exception as error:
+            self.errors[ticker] = error
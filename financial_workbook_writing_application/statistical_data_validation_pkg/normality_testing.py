@@ -16,6 +16,58 @@ import warnings
 class Data_Validation_Warning(UserWarning):
     pass
 
+# Drawing functions shared by the interactive and headless visual tests. They
+# only use the axes passed to them and never the pyplot state machine:
+def plot_histogram(ax, data):
+    '''Draws a histogram of the data on the matplotlib axes.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes that the histogram is drawn on.
+
+    data : Pandas Series
+        The data being tested for normality.
+    '''
+    ax.hist(data.dropna())
+    ax.grid(True)
+    ax.set_title(str(data.name) + ' Column Data Histogram ')
+
+def plot_qq(ax, data):
+    '''Draws a Quantile-Quantile plot of the data on the matplotlib axes.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes that the Q-Q plot is drawn on.
+
+    data : Pandas Series
+        The data being tested for normality.
+    '''
+    ax.set_title(str(data.name) + ' Column Data Q-Q Plot')
+    sm.qqplot(data, scale=3,line='s', ax=ax) # TODO:: Look into QQ, question accuracy
+
+def plot_summary_table(ax, summary_df):
+    '''Draws the normality_validation summary_df as a table on the matplotlib
+    axes.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes that the table is drawn on.
+
+    summary_df : Pandas dataframe
+        The summary dataframe of the statistical normality tests.
+    '''
+    ax.axis('off')
+    # matplotlib table format:
+    table = ax.table(cellText=summary_df.values, rowLabels=summary_df.index,
+    colLabels=summary_df.columns, cellLoc='center')
+    # Formatting:
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1,2)
+
 class normality_validation(object):
     """
     The normality_validation object is designed to perform visual and
@@ -105,31 +157,22 @@ distribution- Data may not be normally distributed',
 
         # Plotting histogram as ax1:
         ax1 = fig.add_subplot(gs[0,0])
-        #ax1.set_title('Histogram')
-        self.data.hist(grid=True, ax=ax1)
-        plt.title(self.data.name + ' Column Data Histogram ')
+        plot_histogram(ax1, self.data)
 
         # Creating a Q-Q plot as ax2:
         ax2 = fig.add_subplot(gs[0,1])
-        ax2.set_title(self.data.name + ' Column Data Q-Q Plot')
-        sm.qqplot(self.data, scale=3,line='s', ax=ax2) # TODO:: Look into QQ, question accuracy
-
-        # Adding summary_df table from __init__ method:
-        ax3 = fig.add_subplot(gs[0, :])
-        ax3.axis('off')
-        # matplotlib table format:
-        table = plt.table(cellText=self.summary_df.values, rowLabels=self.summary_df.index,
-        colLabels=self.summary_df.columns, cellLoc='center')
-        # Formatting:
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1,2)
-
+        plot_qq(ax2, self.data)
 
+        # Adding summary_df table from __init__ method below both plots:
+        ax3 = fig.add_subplot(gs[1, :])
+        plot_summary_table(ax3, self.summary_df)
 
         fig.tight_layout()
         plt.show()
 
+        # Releasing the figure from the pyplot state machine once it is closed:
+        plt.close(fig)
+
     def shapiro_wilk_test(self):
         '''This method performs the shapiro_wilk_test for normality of the
         dataset. It reutrns a dictionary that contains the following information:
@@ -0,0 +1,149 @@
+# Importing the corporate action adjustment stage:
+from financial_workbook_writing_application.data_transformation_pkg\
+.corporate_actions import corporate_action_adjustments, load_corporate_actions
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.security_data_cache import security_data_cache
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.web_based_financial_models import Security
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_data_transformation import dividend_asset
+
+# Importing data management and testing packages:
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def build_history(split_adjusted, periods=40, split_day=20, split_ratio=2.0,
+ dividend_days=(10, 30), dividend=0.5):
+    '''Builds a synthetic price, dividend and split history with one split.
+    The economic history is identical for both bases, only the way the source
+    reports pre-split per share values differs.'''
+    dates = pd.bdate_range('2020-01-01', periods=periods)
+
+    # Split adjusted (current share) close and dividends:
+    close = pd.Series(np.linspace(50.0, 60.0, periods), index=dates)
+    dividends = pd.Series(dividend, index=dates[list(dividend_days)], name='Dividends')
+
+    # Adj Close removes every later dividend from the split adjusted close:
+    dividend_factor = np.ones(periods)
+    for day in dividend_days:
+        dividend_factor[:day] *= 1 - dividend / close.iloc[day - 1]
+    adj_close = close * dividend_factor
+
+    if not split_adjusted:
+        pre_split = dates < dates[split_day]
+        close = close.where(~pre_split, close * split_ratio)
+        dividends = dividends.where(dividends.index >= dates[split_day],
+         dividends * split_ratio)
+
+    prices = pd.DataFrame({'Close': close, 'Adj Close': adj_close})
+    splits = pd.Series([split_ratio], index=[dates[split_day]], name='Stock Splits')
+
+    return prices, dividends, splits
+
+def yields_and_returns(adjustments, prices, dividends):
+    '''Calculates the % dividend yields and returns the way dividend_asset does.'''
+    adjusted_close = adjustments.adjust_prices(prices)['Close']
+    adjusted_dividends = adjustments.adjust_dividends(dividends)
+    pct_yield = adjusted_dividends / adjusted_close[adjusted_dividends.index] * 100
+
+    total_return_prices = adjustments.total_return_prices(prices)
+    returns = (total_return_prices - total_return_prices.iloc[0]) / total_return_prices.iloc[0]
+
+    return adjusted_close, pct_yield, returns
+
+@pytest.mark.parametrize('split_adjusted', [True, False])
+def test_yields_and_returns_share_one_basis_across_a_split(split_adjusted):
+    prices, dividends, splits = build_history(split_adjusted)
+    reference_prices, reference_dividends, _ = build_history(True)
+
+    adjustments = corporate_action_adjustments(prices, splits, split_adjusted)
+    adjusted_close, pct_yield, returns = yields_and_returns(adjustments, prices, dividends)
+
+    # Prices and dividends end up on the split adjusted basis, never adjusted twice:
+    np.testing.assert_allclose(adjusted_close, reference_prices['Close'])
+    np.testing.assert_allclose(adjustments.adjust_dividends(dividends), reference_dividends)
+
+    # Returns come from the same split adjusted close, times the dividend factors:
+    np.testing.assert_allclose(adjustments.total_return_prices(prices),
+     adjusted_close * adjustments.adjustment_factors)
+    np.testing.assert_allclose(returns, (reference_prices['Adj Close'] /
+     reference_prices['Adj Close'].iloc[0]) - 1)
+
+    # Neither series jumps on the split date:
+    split_day = 20
+    close_move = adjusted_close.iloc[split_day] / adjusted_close.iloc[split_day - 1]
+    return_move = (1 + returns.iloc[split_day]) / (1 + returns.iloc[split_day - 1])
+    assert close_move == pytest.approx(return_move)
+    assert close_move == pytest.approx(1.0, abs=0.01)
+
+    # Both dividends yield the same basis regardless of how they were reported:
+    reference_yield = reference_dividends / reference_prices['Close'][reference_dividends.index] * 100
+    np.testing.assert_allclose(pct_yield, reference_yield)
+
+@pytest.mark.parametrize('split_adjusted', [True, False])
+def test_update_matches_a_build_from_scratch(split_adjusted):
+    prices, dividends, splits = build_history(split_adjusted, periods=60)
+
+    # Caching only the history before a later split and a later dividend:
+    cached = corporate_action_adjustments(prices.iloc[:35], splits, split_adjusted)
+    restored = corporate_action_adjustments.from_cache(cached.to_cache())
+
+    # The source re-bases Adj Close for a new dividend and reports a new split:
+    new_prices = prices.copy()
+    new_prices['Adj Close'] = new_prices['Adj Close'] * 0.98
+    new_splits = pd.concat([splits, pd.Series([3.0], index=[prices.index[45]])])
+    if not split_adjusted:
+        pre_split = new_prices.index < prices.index[45]
+        new_prices.loc[pre_split, 'Close'] = new_prices.loc[pre_split, 'Close'] * 3.0
+
+    assert restored.update(new_prices, new_splits)
+
+    rebuilt = corporate_action_adjustments(new_prices, new_splits, split_adjusted)
+    np.testing.assert_array_equal(restored.dates, rebuilt.dates)
+    np.testing.assert_allclose(restored.split_factors, rebuilt.split_factors)
+    np.testing.assert_allclose(restored.adjustment_factors, rebuilt.adjustment_factors)
+    np.testing.assert_allclose(restored.total_return_prices(new_prices),
+     rebuilt.total_return_prices(new_prices))
+
+    # Nothing changes when the same data is seen again:
+    assert not restored.update(new_prices, new_splits)
+
+def test_load_corporate_actions_updates_the_cached_factors(tmp_path):
+    prices, dividends, splits = build_history(True, periods=60)
+    cache = security_data_cache(str(tmp_path))
+
+    load_corporate_actions('TEST', prices.iloc[:30], splits, cache)
+    adjustments = load_corporate_actions('TEST', prices, splits, cache)
+
+    cached = corporate_action_adjustments.from_cache(cache.load_adjustments('TEST'))
+    rebuilt = corporate_action_adjustments(prices, splits)
+
+    np.testing.assert_array_equal(adjustments.dates, rebuilt.dates)
+    np.testing.assert_allclose(cached.adjustment_factors, rebuilt.adjustment_factors)
+    np.testing.assert_allclose(cached.split_factors, rebuilt.split_factors)
+
+@pytest.mark.parametrize('split_adjusted', [True, False])
+def test_dividend_asset_returns_are_computed_once_from_total_return_prices(
+ split_adjusted, raw_data_factory, monkeypatch):
+    raw_data = raw_data_factory('TEST', split_date='2015-06-01',
+     split_adjusted=split_adjusted)
+    reference_raw_data = raw_data_factory('TEST', split_date='2015-06-01')
+
+    calls = []
+    monkeypatch.setattr(Security, 'returns', lambda self, returns=Security.returns:
+     calls.append(self.ticker) or returns(self))
+
+    asset = dividend_asset('TEST', False, raw_data)
+
+    # The parent's returns and statistics are the only ones calculated:
+    assert calls == ['TEST']
+
+    # Returns follow the dividend adjusted price on the split adjusted basis:
+    reference_adj_close = reference_raw_data['historical_prices']['Adj Close']
+    np.testing.assert_allclose(asset.returns['TEST'],
+     reference_adj_close / reference_adj_close.iloc[0] - 1)
+    assert asset.avg_return['TEST'] == pytest.approx(asset.returns['TEST'].mean())
+    assert asset.sharpe_ratio['TEST'] == pytest.approx((asset.returns['TEST'].mean()
+     - 0.023) / asset.returns['TEST'].std())
@@ -0,0 +1,21 @@
+# Importing the data providers and the cache:
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.data_providers import in_memory_data_provider, cached_data_provider
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.security_data_cache import security_data_cache
+
+
+def test_refresh_replaces_the_cached_raw_data(tmp_path, raw_data_factory):
+    provider = in_memory_data_provider({'TEST': raw_data_factory('TEST', years=1)})
+    cached_provider = cached_data_provider(provider, security_data_cache(str(tmp_path)))
+
+    cached_provider.fetch('TEST')
+
+    # New prices are only picked up by refresh() once the ticker is cached:
+    provider.raw_data_dict['TEST'] = raw_data_factory('TEST', years=2)
+    assert len(cached_provider.fetch('TEST')['historical_prices']) < \
+     len(provider.raw_data_dict['TEST']['historical_prices'])
+
+    cached_provider.refresh('TEST')
+    assert len(cached_provider.fetch('TEST')['historical_prices']) == \
+     len(provider.raw_data_dict['TEST']['historical_prices'])
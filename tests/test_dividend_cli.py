@@ -0,0 +1,33 @@
+# Importing the command line interface:
+from financial_workbook_writing_application.dividend_cli import main, build_parser,\
+ budgeted_pipeline_sizes, DEFAULT_MAX_AGE
+
+# Importing testing packages:
+import pytest
+
+
+@pytest.mark.parametrize('argv', [['benchmark', 'A', '--workers', '0'],
+ ['compare', 'A', '--workers', '-2'], ['benchmark', 'A', '--repeat', '0']])
+def test_counts_below_one_are_rejected(argv, capsys):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(argv)
+
+    assert 'must be at least 1' in capsys.readouterr().err
+
+@pytest.mark.parametrize('workers', [1, 4, 16])
+@pytest.mark.parametrize('memory_budget', [None, 1.0, 10.0, 40.0, 1000.0])
+def test_pipeline_sizes_are_at_least_one(workers, memory_budget):
+    args = build_parser().parse_args(['compare', 'A', '--workers', str(workers)])
+    args.memory_budget = memory_budget
+
+    assert min(budgeted_pipeline_sizes(args)) >= 1
+
+def test_cached_prices_expire_by_default():
+    args = build_parser().parse_args(['compare', 'A'])
+
+    assert args.max_age == DEFAULT_MAX_AGE
+
+def test_export_refuses_to_embed_charts_without_png(tmp_path):
+    with pytest.raises(SystemExit, match='png'):
+        main(['export', 'A', '--no-timings', '--excel', str(tmp_path / 'out.xlsx'),
+         '--charts', str(tmp_path), '--chart-format', 'svg'])
@@ -0,0 +1,122 @@
+# Importing the pipeline and the in-process data provider:
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_pipeline import dividend_pipeline
+from financial_workbook_writing_application.raw_data_extraction_pkg\
+.data_providers import in_memory_data_provider
+
+# Importing testing packages:
+import pytest
+# Misc packages imports:
+import time
+import warnings
+
+
+TICKERS = ['T{}'.format(number) for number in range(8)]
+
+class recording_provider(in_memory_data_provider):
+    """
+    An in_memory_data_provider that records an event every time a fetch starts
+    and blocks for delay seconds like a network request.
+    """
+
+    def __init__(self, raw_data_dict, events, delay=0.0):
+        super().__init__(raw_data_dict)
+        self.events = events
+        self.delay = delay
+
+    def fetch(self, ticker):
+        self.events.append(('fetch', ticker))
+        time.sleep(self.delay)
+        return super().fetch(ticker)
+
+@pytest.fixture(scope='module')
+def raw_data_dict(raw_data_factory):
+    '''Builds the raw data of every ticker once for the module.'''
+    return {ticker: raw_data_factory(ticker, years=4, seed=seed)
+     for seed, ticker in enumerate(TICKERS)}
+
+@pytest.fixture(autouse=True)
+def ignore_validation_warnings():
+    '''The normality tests of every synthetic ticker warn about small samples.'''
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        yield
+
+def slow_loader(events, seconds):
+    '''Returns a blocking loader that records an event once it is finished.'''
+    def loader(ticker, div_obj):
+        time.sleep(seconds)
+        events.append(('load', ticker))
+
+    return loader
+
+def test_output_is_in_input_order_and_loaded(raw_data_dict):
+    loaded = []
+    pipeline = dividend_pipeline(in_memory_data_provider(raw_data_dict),
+     loader=lambda ticker, div_obj: loaded.append((ticker, div_obj)),
+     fetch_workers=3, transform_workers=2, queue_size=2)
+
+    tickers = list(reversed(TICKERS))
+    asset_dict = pipeline.process(tickers)
+
+    assert list(asset_dict) == tickers
+    assert all(div_obj.ticker == ticker for ticker, div_obj in asset_dict.items())
+    assert sorted(loaded, key=lambda item: item[0]) == sorted(asset_dict.items())
+    assert pipeline.errors == {}
+
+def test_fetch_and_transform_failures_are_recorded(raw_data_dict):
+    raw_data_dict = dict(raw_data_dict, BROKEN={'title': 'BROKEN'})
+    pipeline = dividend_pipeline(in_memory_data_provider(raw_data_dict))
+
+    asset_dict = pipeline.process(['T0', 'MISSING', 'BROKEN', 'T1'])
+
+    assert list(asset_dict) == ['T0', 'T1']
+    assert set(pipeline.errors) == {'MISSING', 'BROKEN'}
+    assert isinstance(pipeline.errors['MISSING'], KeyError)
+
+def test_coroutine_loader_is_awaited(raw_data_dict):
+    loaded = []
+
+    async def loader(ticker, div_obj):
+        loaded.append(ticker)
+
+    pipeline = dividend_pipeline(in_memory_data_provider(raw_data_dict), loader=loader)
+    pipeline.process(TICKERS[:3])
+
+    assert sorted(loaded) == TICKERS[:3]
+
+def test_blocking_loader_does_not_stall_fetching(raw_data_dict):
+    events = []
+    pipeline = dividend_pipeline(recording_provider(raw_data_dict, events, 0.05),
+     loader=slow_loader(events, 0.5), fetch_workers=1, transform_workers=2,
+     queue_size=len(TICKERS))
+
+    pipeline.process(TICKERS)
+
+    # With room in every queue each fetch runs while earlier tickers load:
+    first_loads = [event for event in events if event[0] == 'load'][:2]
+    assert events.index(first_loads[1]) > max(index for index, event
+     in enumerate(events) if event[0] == 'fetch')
+
+def test_slow_loader_throttles_fetching(raw_data_dict):
+    events = []
+    pipeline = dividend_pipeline(recording_provider(raw_data_dict, events),
+     loader=slow_loader(events, 0.2), fetch_workers=1, transform_workers=1,
+     queue_size=1)
+
+    pipeline.process(TICKERS)
+
+    # At most one ticker is held by each worker and each queue slot:
+    fetched = loaded = 0
+    for kind, ticker in events:
+        fetched += kind == 'fetch'
+        loaded += kind == 'load'
+        assert fetched - loaded <= 5
+
+    assert loaded == len(TICKERS)
+
+@pytest.mark.parametrize('option', ['fetch_workers', 'transform_workers',
+ 'load_workers', 'queue_size'])
+def test_counts_below_one_are_rejected(option, raw_data_dict):
+    with pytest.raises(ValueError, match=option):
+        dividend_pipeline(in_memory_data_provider(raw_data_dict), **{option: 0})
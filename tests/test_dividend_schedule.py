@@ -0,0 +1,69 @@
+# Importing the payment schedule index:
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_schedule import payment_schedule_index, build_dividend_calendar
+
+# Importing data management and testing packages:
+import pandas as pd
+import pytest
+
+
+def build_dividends(dates, amount=0.25):
+    '''Builds a dividend history paying the same amount on every date.'''
+    return pd.Series(amount, index=pd.DatetimeIndex(dates), name='Dividends')
+
+def quarterly_dates(start_year, end_year):
+    '''Returns mid quarter ex-dividend dates for every year in the range.'''
+    return [pd.Timestamp(year, month, 15) for year in range(start_year, end_year + 1)
+     for month in (2, 5, 8, 11)]
+
+def monthly_dates(start_year, end_year):
+    '''Returns mid month ex-dividend dates for every year in the range.'''
+    return [pd.Timestamp(year, month, 15) for year in range(start_year, end_year + 1)
+     for month in range(1, 13)]
+
+def test_schedule_change_keeps_earlier_years_complete():
+    dividends = build_dividends(quarterly_dates(2015, 2019) + monthly_dates(2020, 2023))
+    schedule = payment_schedule_index('TEST', dividends)
+
+    assert schedule.frequency == 12
+    assert schedule.year_frequencies[2016] == 4
+    assert schedule.year_frequencies[2021] == 12
+
+    assert all(schedule.is_complete_year(year) for year in range(2015, 2024))
+
+@pytest.mark.parametrize('missing_months', [(8,), (5, 8), (8, 11), (5, 8, 11),
+ (2, 5, 8), (2, 8, 11)])
+def test_missing_payments_make_a_year_incomplete(missing_months):
+    dates = [date for date in quarterly_dates(2015, 2019)
+     if date.year != 2017 or date.month not in missing_months]
+    schedule = payment_schedule_index('TEST', build_dividends(dates))
+
+    assert schedule.year_frequencies[2017] == 4
+    assert not schedule.is_complete_year(2017)
+    assert schedule.is_complete_year(2016)
+    assert schedule.is_complete_year(2018)
+
+def test_missing_payments_in_the_last_year_keep_the_schedule():
+    dates = [date for date in quarterly_dates(2015, 2019)
+     if date.year != 2019 or date.month == 2]
+    schedule = payment_schedule_index('TEST', build_dividends(dates))
+
+    assert schedule.year_frequencies[2019] == 4
+    assert not schedule.is_complete_year(2019)
+
+def test_first_partial_year_is_incomplete():
+    dates = [date for date in quarterly_dates(2015, 2017) if date.year > 2015 or date.month > 6]
+    schedule = payment_schedule_index('TEST', build_dividends(dates))
+
+    assert not schedule.is_complete_year(2015)
+    assert schedule.is_complete_year(2016)
+
+def test_forecast_calendar_continues_the_recent_schedule():
+    dividends = build_dividends(quarterly_dates(2015, 2019) + monthly_dates(2020, 2021))
+    schedule = payment_schedule_index('TEST', dividends)
+
+    calendar_df = build_dividend_calendar([schedule], '2022-01-01', '2022-06-30')
+
+    assert len(calendar_df) == 6
+    assert (calendar_df['ex_date'].dt.day == 15).all()
+    assert (calendar_df['amount'] == 0.25).all()
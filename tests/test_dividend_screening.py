@@ -0,0 +1,76 @@
+# Importing the dividend screener:
+from financial_workbook_writing_application.data_transformation_pkg\
+.dividend_screening import dividend_screener
+
+# Importing data management and testing packages:
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def build_metrics(count=40, seed=0):
+    '''Builds a metrics dataframe with repeated values, so that comparisons hit
+    values that are in the columns, and NaN values in every column.'''
+    rng = np.random.default_rng(seed)
+
+    metrics_df = pd.DataFrame({
+        'div_yield': rng.integers(0, 12, count) / 2,
+        'forward_yield': rng.uniform(0, 8, count),
+        'std': rng.integers(1, 6, count) / 2,
+        'max_drawdown': rng.integers(0, 8, count) / 4,
+        'growth': rng.normal(0, 3, count),
+        'gaussian': rng.integers(0, 2, count).astype(float)},
+        index=pd.Index(['T{}'.format(number) for number in range(count)], name='ticker'))
+
+    for column in metrics_df.columns:
+        metrics_df.loc[rng.choice(metrics_df.index, 5, replace=False), column] = np.nan
+
+    return metrics_df
+
+@pytest.fixture
+def metrics_df():
+    return build_metrics()
+
+@pytest.mark.parametrize('where', [
+    'div_yield > 3', 'div_yield >= 3', 'div_yield < 3', 'div_yield <= 3',
+    'div_yield == 3', 'div_yield != 3', 'div_yield > 100', 'div_yield < -1',
+    'div_yield != 100', 'yield > 2.5% and drawdown <= 1', 'yield >= 3 & std < 2',
+    'div_yield > std and gaussian == 1', 'yield > 4 or drawdown < 0.5',
+    'not (yield > 3)', '(yield > 2) and (std < 2)', 'growth > -1.5 and forward_yield < 6'])
+def test_filter_matches_a_plain_eval(metrics_df, where):
+    screener = dividend_screener(metrics_df)
+
+    expected = pd.eval(screener._normalize(where),
+     local_dict={column: metrics_df[column].values for column in metrics_df.columns})
+
+    np.testing.assert_array_equal(screener.filter(where), np.asarray(expected, dtype=bool))
+
+@pytest.mark.parametrize('top', [None, 1, 5, 34, 39, 40, 100])
+@pytest.mark.parametrize('ascending', [False, True])
+def test_screen_top_matches_a_full_sort(metrics_df, top, ascending):
+    screener = dividend_screener(metrics_df)
+    where, rank_by = 'yield > 1', 'forward_yield / std'
+
+    # Full sort of the passing tickers with NaN scores ranked last:
+    passing_df = metrics_df[screener.filter(where)].copy()
+    passing_df['score'] = passing_df['forward_yield'] / passing_df['std']
+    expected_df = passing_df.sort_values('score', ascending=ascending,
+     na_position='last', kind='stable').iloc[:top]
+
+    screen_df = screener.screen(where, rank_by, top, ascending)
+
+    np.testing.assert_array_equal(screen_df['score'].values, expected_df['score'].values)
+    ranked = expected_df['score'].notna().values
+    assert list(screen_df.index[ranked]) == list(expected_df.index[ranked])
+
+@pytest.mark.parametrize('rank_by', [None, 'yield / std'])
+@pytest.mark.parametrize('top', [0, -1, -5])
+def test_top_below_one_returns_nothing(metrics_df, rank_by, top):
+    screen_df = dividend_screener(metrics_df).screen('yield > 1', rank_by, top)
+
+    assert len(screen_df) == 0
+
+def test_screen_without_rank_keeps_the_input_order(metrics_df):
+    screen_df = dividend_screener(metrics_df).screen('yield > 1', top=3)
+
+    assert list(screen_df.index) == list(metrics_df.index[metrics_df['div_yield'] > 1][:3])
@@ -0,0 +1,84 @@
+# Importing the chart renderer:
+from financial_workbook_writing_application.statistical_data_validation_pkg\
+import normality_chart_rendering
+from financial_workbook_writing_application.statistical_data_validation_pkg\
+.normality_chart_rendering import normality_chart_renderer, CHART_TYPES
+
+# Importing data management and testing packages:
+import pandas as pd
+import numpy as np
+import pytest
+import xlsxwriter
+# Misc packages imports:
+import os
+import time
+
+
+_render_ticker = normality_chart_rendering._render_ticker
+
+def slow_render_ticker(ticker, data, alpha, output_dir, formats):
+    '''Renders every ticker except SLOW, which never finishes in time.'''
+    if ticker == 'SLOW':
+        time.sleep(60)
+
+    return _render_ticker(ticker, data, alpha, output_dir, formats)
+
+def build_data_dict(tickers):
+    '''Builds a short series of annual yields for every ticker.'''
+    rng = np.random.default_rng(0)
+
+    return {ticker: pd.Series(rng.normal(4, 1, 12), index=range(2008, 2020))
+     for ticker in tickers}
+
+def test_serial_render_writes_every_chart_and_clears_the_templates(tmp_path):
+    renderer = normality_chart_renderer(str(tmp_path), formats=('png', 'svg'), workers=0)
+    manifest = renderer.render(build_data_dict(['A', 'B']))
+
+    assert renderer.errors == {}
+    assert set(manifest) == {'A', 'B'}
+
+    for ticker, path_dict in manifest.items():
+        assert list(path_dict) == list(CHART_TYPES)
+
+        for chart, paths in path_dict.items():
+            assert [os.path.basename(path) for path in paths] == [
+             '{}_{}.png'.format(ticker, chart), '{}_{}.svg'.format(ticker, chart)]
+            assert all(os.path.getsize(path) > 0 for path in paths)
+
+    # No artists are held by the templates between tickers:
+    for fig, ax in normality_chart_rendering._templates.values():
+        assert fig.axes == [ax]
+        assert not (ax.lines or ax.patches or ax.collections or ax.tables or ax.texts)
+
+def test_parallel_render_times_out_a_stuck_ticker(tmp_path, monkeypatch):
+    monkeypatch.setattr(normality_chart_rendering, '_render_ticker', slow_render_ticker)
+
+    renderer = normality_chart_renderer(str(tmp_path), workers=2, max_in_flight=2,
+     timeout=5.0)
+
+    start = time.monotonic()
+    manifest = renderer.render(build_data_dict(['A', 'SLOW', 'B', 'C']))
+
+    # The stuck worker is killed and the tickers pending behind it are rendered:
+    assert time.monotonic() - start < 30
+    assert list(renderer.errors) == ['SLOW']
+    assert isinstance(renderer.errors['SLOW'], TimeoutError)
+    assert sorted(manifest) == ['A', 'B', 'C']
+    assert all(os.path.exists(paths[0]) for path_dict in manifest.values()
+     for paths in path_dict.values())
+
+def test_embedding_requires_png(tmp_path):
+    workbook = xlsxwriter.Workbook(str(tmp_path / 'charts.xlsx'))
+    worksheet = workbook.add_worksheet()
+
+    renderer = normality_chart_renderer(str(tmp_path), formats=('svg',), workers=0)
+    renderer.render(build_data_dict(['A']))
+
+    with pytest.raises(ValueError, match='png'):
+        renderer.embed_in_worksheet(worksheet, 'A')
+
+    renderer = normality_chart_renderer(str(tmp_path), formats=('svg', 'png'), workers=0)
+    renderer.render(build_data_dict(['A']))
+    renderer.embed_in_worksheet(worksheet, 'A')
+
+    workbook.close()